@@ -5,4 +5,8 @@ echo "Installing dependencies..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
+echo "Applying migrations..."
+# Also seeds the location catalog (post_migrate).
+python manage.py migrate --noinput
+
 echo "Build complete!"
@@ -71,9 +71,44 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Reuse connections across requests; the short API views are dominated by connect time otherwise.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# ============= CACHE =============
+# Per-process memory cache by default, which is only coherent with a single worker:
+# a write invalidates cached entries in the worker that handled it and nowhere else.
+# Set REDIS_URL whenever more than one worker serves requests; it needs the optional
+# redis package (pip install "redis>=4.0"), which requirements.txt does not install.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# ProfileModelBackend authenticates new logins; ModelBackend stays listed so sessions
+# created before it keep resolving (their role falls back to role_for()).
+AUTHENTICATION_BACKENDS = [
+    'core.backends.ProfileModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# ============= SCORING =============
+# Default probability comes from the closed-form risk formula; set True to serve the RandomForest instead.
+RF_MODEL_ENABLED = os.environ.get('RF_MODEL_ENABLED', 'False') == 'True'
+# Fitted models are persisted here so workers load them instead of retraining on boot.
+RF_MODEL_CACHE_DIR = os.environ.get('RF_MODEL_CACHE_DIR', BASE_DIR / 'model_cache')
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = 'en-us'
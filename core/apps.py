@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from django.conf import settings
+
+        from . import signals  # noqa: F401
+
+        if settings.RF_MODEL_ENABLED:
+            # Fit or load the model at boot rather than inside the first scoring request.
+            from .views import get_rf_predictor
+
+            get_rf_predictor()
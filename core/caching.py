@@ -0,0 +1,44 @@
+import uuid
+
+from django.core.cache import cache
+
+
+# The location lookup blob is stored under a versioned key; bumping the version
+# invalidates every worker's copy without knowing which keys they hold.
+LOCATION_LOOKUP_VERSION_KEY = "locationlookup:version"
+LOCATION_LOOKUP_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def location_lookup_cache_key(version):
+    return f"locationlookup:{version}"
+
+
+def new_cache_version():
+    return uuid.uuid4().hex
+
+
+def location_lookup_version():
+    return cache.get_or_set(LOCATION_LOOKUP_VERSION_KEY, new_cache_version, timeout=None)
+
+
+def invalidate_location_lookup():
+    cache.set(LOCATION_LOOKUP_VERSION_KEY, new_cache_version(), timeout=None)
+
+
+# Each user's place history snapshot is keyed by a per-user version token that
+# writes replace after they commit. A GET that read rows before a write can only
+# store its snapshot under the old token, which no later read asks for.
+def place_history_version_key(user_id):
+    return f"placehist:version:{user_id}"
+
+
+def place_history_cache_key(user_id, version):
+    return f"placehist:v4:{user_id}:{version}"
+
+
+def place_history_version(user_id):
+    return cache.get_or_set(place_history_version_key(user_id), new_cache_version, timeout=None)
+
+
+def invalidate_place_history(user_id):
+    cache.set(place_history_version_key(user_id), new_cache_version(), timeout=None)
@@ -1,13 +1,28 @@
 from django.core.management.base import BaseCommand
-from core.models import ClimateCreditApplication
+from core.models import ClimateCreditApplication, UserDashboardSummary
 from core.views import early_warning
 
 
 class Command(BaseCommand):
     help = 'Update early warning messages for existing applications'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
     def handle(self, *args, **options):
-        applications = ClimateCreditApplication.objects.all()
+        batch_size = options['batch_size']
+        applications = ClimateCreditApplication.objects.stream_for_recompute(
+            'user',
+            'default_probability',
+            'climate_risk_score',
+            'esg_risk_score',
+            'adjusted_credit_score',
+            'early_warning_flag',
+            'early_warning_message',
+            chunk_size=min(batch_size, 2000),
+        )
+        changed = []
+        touched_users = set()
         updated_count = 0
 
         for app in applications:
@@ -21,9 +36,25 @@ class Command(BaseCommand):
             if app.early_warning_flag != warning_flag or app.early_warning_message != warning_msg:
                 app.early_warning_flag = warning_flag
                 app.early_warning_message = warning_msg
-                app.save(update_fields=['early_warning_flag', 'early_warning_message'])
-                updated_count += 1
+                changed.append(app)
+                touched_users.add(app.user_id)
+
+            if len(changed) >= batch_size:
+                updated_count += self.flush(changed)
+
+        updated_count += self.flush(changed)
+
+        # bulk_update skips post_save, so summaries are refreshed here.
+        for user_id in touched_users:
+            UserDashboardSummary.refresh(user_id)
 
         self.stdout.write(
             self.style.SUCCESS(f'Successfully updated {updated_count} applications with new warning messages')
-        )
\ No newline at end of file
+        )
+
+    def flush(self, changed):
+        count = len(changed)
+        if count:
+            ClimateCreditApplication.objects.bulk_update(changed, ['early_warning_flag', 'early_warning_message'])
+            changed.clear()
+        return count
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_alter_locationcatalog_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='action',
+            field=models.CharField(choices=[('create', 'Create Application'), ('override', 'Manager Override'), ('final_confirm', 'Final Decision Confirmation'), ('delete', 'Delete Application')], max_length=40),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['application', '-created_at'], name='core_auditl_applica_ae66fe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='climatecreditapplication',
+            index=models.Index(fields=['user', '-created_at'], name='core_climat_user_id_891f39_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='climatecreditapplication',
+            index=models.Index(fields=['final_decision'], name='core_climat_final_d_20e8c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='climatecreditapplication',
+            index=models.Index(fields=['climate_risk_classification'], name='core_climat_climate_502f0c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='climatecreditapplication',
+            index=models.Index(fields=['early_warning_flag'], name='core_climat_early_w_f6320e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='placehistory',
+            index=models.Index(fields=['user', '-created_at'], name='core_placeh_user_id_e19416_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:44
+
+from django.db import migrations, models
+
+
+CLIMATE_CODES = {"Low": "1", "Moderate": "2", "High": "3", "Severe": "4"}
+
+
+def classification_to_code(apps, schema_editor):
+    ClimateCreditApplication = apps.get_model("core", "ClimateCreditApplication")
+    for label, code in CLIMATE_CODES.items():
+        ClimateCreditApplication.objects.filter(climate_risk_classification=label).update(climate_risk_classification=code)
+
+
+def code_to_classification(apps, schema_editor):
+    ClimateCreditApplication = apps.get_model("core", "ClimateCreditApplication")
+    for label, code in CLIMATE_CODES.items():
+        ClimateCreditApplication.objects.filter(climate_risk_classification=code).update(climate_risk_classification=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_alter_auditlog_action_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(classification_to_code, code_to_classification),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='climate_risk_classification',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Low'), (2, 'Moderate'), (3, 'High'), (4, 'Severe')], default=1),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='location_district',
+            field=models.CharField(db_index=True, max_length=80),
+        ),
+    ]
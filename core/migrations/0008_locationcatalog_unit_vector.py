@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:45
+
+import math
+
+from django.db import migrations, models
+
+
+def backfill_unit_vectors(apps, schema_editor):
+    LocationCatalog = apps.get_model("core", "LocationCatalog")
+    locations = list(LocationCatalog.objects.all())
+    for location in locations:
+        lat_r = math.radians(location.latitude)
+        lon_r = math.radians(location.longitude)
+        location.x = math.cos(lat_r) * math.cos(lon_r)
+        location.y = math.cos(lat_r) * math.sin(lon_r)
+        location.z = math.sin(lat_r)
+    LocationCatalog.objects.bulk_update(locations, ["x", "y", "z"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_climate_classification_ordinal'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='locationcatalog',
+            name='x',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='locationcatalog',
+            name='y',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='locationcatalog',
+            name='z',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_unit_vectors, migrations.RunPython.noop),
+    ]
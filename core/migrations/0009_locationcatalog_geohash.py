@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:45
+
+from django.db import migrations, models
+
+
+# Frozen copy of core.models.geohash as of this migration: 31-bit lat/lon grid
+# cells interleaved into a 62-bit Z-order key.
+GEOHASH_BITS = 31
+
+
+def _spread_bits(value):
+    value &= 0xFFFFFFFF
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    value = (value | (value << 1)) & 0x5555555555555555
+    return value
+
+
+def _geohash(latitude, longitude):
+    scale = 1 << GEOHASH_BITS
+    lat_cell = min(scale - 1, int((latitude + 90) / 180 * scale))
+    lon_cell = min(scale - 1, int((longitude + 180) / 360 * scale))
+    return (_spread_bits(lon_cell) << 1) | _spread_bits(lat_cell)
+
+
+def backfill_geohash(apps, schema_editor):
+    LocationCatalog = apps.get_model("core", "LocationCatalog")
+    locations = list(LocationCatalog.objects.all())
+    for location in locations:
+        location.geohash = _geohash(location.latitude, location.longitude)
+    LocationCatalog.objects.bulk_update(locations, ["geohash"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_locationcatalog_unit_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='locationcatalog',
+            name='geohash',
+            field=models.BigIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:46
+
+import json
+
+from django.db import migrations, models
+
+
+def _parse_value(raw):
+    try:
+        return float(raw.rstrip("%"))
+    except ValueError:
+        return raw
+
+
+def text_to_json(apps, schema_editor):
+    # Legacy rows hold "key=value, key=value" strings.
+    AuditLog = apps.get_model("core", "AuditLog")
+    for log in AuditLog.objects.only("id", "risk_factors").iterator():
+        factors = {}
+        for pair in (log.risk_factors or "").split(","):
+            key, sep, value = pair.partition("=")
+            if sep:
+                factors[key.strip()] = _parse_value(value.strip())
+        AuditLog.objects.filter(id=log.id).update(risk_factors=json.dumps(factors))
+
+
+def json_to_text(apps, schema_editor):
+    AuditLog = apps.get_model("core", "AuditLog")
+    for log in AuditLog.objects.only("id", "risk_factors").iterator():
+        factors = json.loads(log.risk_factors or "{}")
+        text = ", ".join(f"{key}={value}" for key, value in factors.items())
+        AuditLog.objects.filter(id=log.id).update(risk_factors=text)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_locationcatalog_geohash'),
+    ]
+
+    operations = [
+        migrations.RunPython(text_to_json, json_to_text),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='risk_factors',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:49
+
+from django.db import migrations, models
+
+
+DECISION_CODES = {"Auto Approve": "1", "Conditional Approve": "2", "Reject": "3"}
+ACTION_CODES = {"create": "1", "override": "2", "final_confirm": "3", "delete": "4"}
+
+APPLICATION_DECISION_FIELDS = ("decision", "manager_override_decision", "final_decision")
+
+
+def _remap(queryset, field, mapping):
+    for old, new in mapping.items():
+        queryset.filter(**{field: old}).update(**{field: new})
+
+
+def labels_to_codes(apps, schema_editor):
+    ClimateCreditApplication = apps.get_model("core", "ClimateCreditApplication")
+    AuditLog = apps.get_model("core", "AuditLog")
+
+    for field in APPLICATION_DECISION_FIELDS:
+        _remap(ClimateCreditApplication.objects.all(), field, DECISION_CODES)
+    ClimateCreditApplication.objects.filter(manager_override_decision="").update(manager_override_decision=None)
+
+    _remap(AuditLog.objects.all(), "decision", DECISION_CODES)
+    AuditLog.objects.filter(decision="").update(decision=None)
+    _remap(AuditLog.objects.all(), "action", ACTION_CODES)
+
+
+def codes_to_labels(apps, schema_editor):
+    ClimateCreditApplication = apps.get_model("core", "ClimateCreditApplication")
+    AuditLog = apps.get_model("core", "AuditLog")
+    decision_labels = {code: label for label, code in DECISION_CODES.items()}
+    action_labels = {code: label for label, code in ACTION_CODES.items()}
+
+    for field in APPLICATION_DECISION_FIELDS:
+        _remap(ClimateCreditApplication.objects.all(), field, decision_labels)
+    ClimateCreditApplication.objects.filter(manager_override_decision=None).update(manager_override_decision="")
+
+    _remap(AuditLog.objects.all(), "decision", decision_labels)
+    AuditLog.objects.filter(decision=None).update(decision="")
+    _remap(AuditLog.objects.all(), "action", action_labels)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_auditlog_risk_factors_json'),
+    ]
+
+    operations = [
+        # Blank values become NULL once these columns are integers.
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='manager_override_decision',
+            field=models.CharField(blank=True, max_length=30, null=True),
+        ),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='decision',
+            field=models.CharField(blank=True, max_length=30, null=True),
+        ),
+        migrations.RunPython(labels_to_codes, codes_to_labels),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='action',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Create Application'), (2, 'Manager Override'), (3, 'Final Decision Confirmation'), (4, 'Delete Application')]),
+        ),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='decision',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Auto Approve'), (2, 'Conditional Approve'), (3, 'Reject')], null=True),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='decision',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Auto Approve'), (2, 'Conditional Approve'), (3, 'Reject')], default=2),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='final_decision',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Auto Approve'), (2, 'Conditional Approve'), (3, 'Reject')], default=2),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='manager_override_decision',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, 'Auto Approve'), (2, 'Conditional Approve'), (3, 'Reject')], null=True),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+# BRIN indexes exist only on PostgreSQL; other backends keep the B-tree indexes alone.
+BRIN_INDEXES = (
+    ("core_auditl_created_brin", "core_auditlog"),
+    ("core_placeh_created_brin", "core_placehistory"),
+)
+
+
+def create_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table in BRIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING brin ("created_at") WITH (pages_per_range = 32)'
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table in BRIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_decision_action_small_int'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_created_at_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='locationcatalog',
+            name='name',
+            field=models.CharField(max_length=120),
+        ),
+        migrations.AddIndex(
+            model_name='locationcatalog',
+            index=models.Index(condition=models.Q(('is_custom', False)), fields=['name'], name='loc_global_name_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='locationcatalog',
+            constraint=models.UniqueConstraint(fields=('state', 'name'), name='uniq_loc_state_name'),
+        ),
+    ]
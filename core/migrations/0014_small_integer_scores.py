@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:52
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_locationcatalog_state_name_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='adjusted_credit_score',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='ai_credit_score',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='climate_risk_score',
+            field=models.PositiveSmallIntegerField(default=0, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='esg_aligned_credit_score',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='esg_risk_score',
+            field=models.PositiveSmallIntegerField(default=0, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='property_risk_score',
+            field=models.PositiveSmallIntegerField(default=0, validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+        migrations.AlterField(
+            model_name='climatecreditapplication',
+            name='suggested_tenure_months',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Q, Sum
+
+
+SUM_FIELDS = {
+    "sum_risk": "climate_risk_score",
+    "sum_default": "default_probability",
+    "sum_esg": "esg_risk_score",
+    "sum_interest": "suggested_interest_rate",
+    "sum_ai_credit": "ai_credit_score",
+    "sum_esg_credit": "esg_aligned_credit_score",
+}
+
+
+def backfill_summaries(apps, schema_editor):
+    ClimateCreditApplication = apps.get_model("core", "ClimateCreditApplication")
+    UserDashboardSummary = apps.get_model("core", "UserDashboardSummary")
+    rows = ClimateCreditApplication.objects.order_by().values("user_id").annotate(
+        total_apps=Count("id"),
+        approved=Count("id", filter=Q(final_decision=1)),
+        conditional=Count("id", filter=Q(final_decision=2)),
+        rejected=Count("id", filter=Q(final_decision=3)),
+        warnings=Count("id", filter=Q(early_warning_flag=True)),
+        **{key: Sum(field) for key, field in SUM_FIELDS.items()},
+    )
+    UserDashboardSummary.objects.bulk_create(
+        [UserDashboardSummary(**row) for row in rows],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0014_small_integer_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserDashboardSummary',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='dashboard_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_apps', models.PositiveIntegerField(default=0)),
+                ('approved', models.PositiveIntegerField(default=0)),
+                ('conditional', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('warnings', models.PositiveIntegerField(default=0)),
+                ('sum_risk', models.FloatField(default=0)),
+                ('sum_default', models.FloatField(default=0)),
+                ('sum_esg', models.FloatField(default=0)),
+                ('sum_interest', models.FloatField(default=0)),
+                ('sum_ai_credit', models.FloatField(default=0)),
+                ('sum_esg_credit', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_user_dashboard_summary'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='application',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='audit_logs', to='core.climatecreditapplication'),
+        ),
+    ]
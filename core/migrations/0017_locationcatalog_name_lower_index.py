@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:06
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_auditlog_application_no_db_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='locationcatalog',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='location_name_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+# PostgreSQL keeps each user's history at the newest PLACE_HISTORY_LIMIT rows on
+# insert; other backends trim in the view. Frozen here: the view's constant of the
+# same name must match, and changing it needs a migration that replaces the trigger.
+PLACE_HISTORY_LIMIT = 12
+
+TRIM_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION core_placehistory_trim() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM core_placehistory
+    WHERE user_id = NEW.user_id
+      AND id IN (
+        SELECT id FROM core_placehistory
+        WHERE user_id = NEW.user_id
+        ORDER BY created_at DESC
+        OFFSET {limit}
+      );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS core_placehistory_trim ON core_placehistory;
+CREATE TRIGGER core_placehistory_trim
+    AFTER INSERT ON core_placehistory
+    FOR EACH ROW EXECUTE FUNCTION core_placehistory_trim();
+"""
+
+DROP_TRIM_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS core_placehistory_trim ON core_placehistory;
+DROP FUNCTION IF EXISTS core_placehistory_trim();
+"""
+
+
+def drop_duplicate_places(apps, schema_editor):
+    PlaceHistory = apps.get_model("core", "PlaceHistory")
+    duplicates = (
+        PlaceHistory.objects.values("user_id", "latitude", "longitude")
+        .annotate(total=Count("id"), newest=Max("id"))
+        .filter(total__gt=1)
+    )
+    for row in duplicates:
+        PlaceHistory.objects.filter(
+            user_id=row["user_id"],
+            latitude=row["latitude"],
+            longitude=row["longitude"],
+        ).exclude(pk=row["newest"]).delete()
+
+
+def create_trim_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(TRIM_TRIGGER_SQL.format(limit=PLACE_HISTORY_LIMIT))
+
+
+def drop_trim_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_TRIM_TRIGGER_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_locationcatalog_name_lower_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_places, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='placehistory',
+            constraint=models.UniqueConstraint(fields=('user', 'latitude', 'longitude'), name='uniq_user_place'),
+        ),
+        migrations.RunPython(create_trim_trigger, drop_trim_trigger),
+    ]
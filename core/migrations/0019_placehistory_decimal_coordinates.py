@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_placehistory_unique_place_and_trim_trigger'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='placehistory',
+            name='latitude',
+            field=models.DecimalField(decimal_places=4, max_digits=8),
+        ),
+        migrations.AlterField(
+            model_name='placehistory',
+            name='longitude',
+            field=models.DecimalField(decimal_places=4, max_digits=8),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:15
+
+from django.db import migrations, models
+
+
+# INCLUDE columns exist only on PostgreSQL, where the plain index is rebuilt as a
+# covering one; other backends keep the plain (user, created_at) B-tree.
+PLAIN_INDEX_SQL = 'CREATE INDEX "placehist_user_created_idx" ON "core_placehistory" ("user_id", "created_at" DESC)'
+COVERING_INDEX_SQL = (
+    'CREATE INDEX "placehist_user_created_idx" ON "core_placehistory" ("user_id", "created_at" DESC) '
+    'INCLUDE ("id", "place_name", "latitude", "longitude")'
+)
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "placehist_user_created_idx"')
+    schema_editor.execute(COVERING_INDEX_SQL)
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "placehist_user_created_idx"')
+    schema_editor.execute(PLAIN_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_placehistory_decimal_coordinates'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='placehistory',
+            name='core_placeh_user_id_e19416_idx',
+        ),
+        migrations.AddIndex(
+            model_name='placehistory',
+            index=models.Index(fields=['user', '-created_at'], name='placehist_user_created_idx'),
+        ),
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
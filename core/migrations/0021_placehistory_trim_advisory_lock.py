@@ -0,0 +1,49 @@
+from django.db import migrations
+
+
+# Same-user inserts take a transaction-scoped advisory lock before trimming, so
+# concurrent saves trim one after another instead of racing over the same rows.
+# Frozen copy of the cap from 0018; keep in step with core.views.PLACE_HISTORY_LIMIT.
+PLACE_HISTORY_LIMIT = 12
+
+TRIM_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION core_placehistory_trim() RETURNS trigger AS $$
+BEGIN
+    {lock}
+    DELETE FROM core_placehistory
+    WHERE user_id = NEW.user_id
+      AND id IN (
+        SELECT id FROM core_placehistory
+        WHERE user_id = NEW.user_id
+        ORDER BY created_at DESC
+        OFFSET {limit}
+      );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ADVISORY_LOCK_SQL = "PERFORM pg_advisory_xact_lock(hashtext('core_placehistory'), NEW.user_id::integer);"
+
+
+def add_advisory_lock(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(TRIM_FUNCTION_SQL.format(lock=ADVISORY_LOCK_SQL, limit=PLACE_HISTORY_LIMIT))
+
+
+def remove_advisory_lock(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(TRIM_FUNCTION_SQL.format(lock="", limit=PLACE_HISTORY_LIMIT))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_placehistory_covering_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_advisory_lock, remove_advisory_lock),
+    ]
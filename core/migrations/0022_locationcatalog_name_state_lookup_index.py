@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:28
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_placehistory_trim_advisory_lock'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='locationcatalog',
+            name='loc_global_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='locationcatalog',
+            name='location_name_lower_idx',
+        ),
+        migrations.AddIndex(
+            model_name='locationcatalog',
+            index=models.Index(django.db.models.functions.text.Lower('name'), models.F('state'), name='location_name_state_idx'),
+        ),
+    ]
@@ -1,5 +1,12 @@
+import math
+
+import numpy as np
 from django.contrib.auth.models import User
-from django.db import models
+from django.core.cache import cache
+from django.core.validators import MaxValueValidator
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Lower, Now
 
 
 class UserProfile(models.Model):
@@ -11,6 +18,7 @@ class UserProfile(models.Model):
         (ROLE_MANAGER, "Manager"),
         (ROLE_AUDITOR, "Auditor"),
     ]
+    VALID_ROLES = frozenset(dict(ROLE_CHOICES))
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default=ROLE_OFFICER)
@@ -19,8 +27,94 @@ class UserProfile(models.Model):
         return f"{self.user.username} ({self.role})"
 
 
+# Short enough that workers not sharing a cache backend pick up role changes quickly.
+ROLE_CACHE_TIMEOUT = 60
+
+
+def role_cache_key(user_id):
+    return f"role:{user_id}"
+
+
+def role_for(user_id):
+    """Cached role lookup; the entry is dropped whenever the user's UserProfile is saved or deleted."""
+    def load_role():
+        profile, _created = UserProfile.objects.only("role").get_or_create(user_id=user_id)
+        return profile.role
+
+    return cache.get_or_set(role_cache_key(user_id), load_role, ROLE_CACHE_TIMEOUT)
+
+
+def unit_vector(latitude, longitude):
+    """Map a lat/lon pair to its (x, y, z) point on the unit sphere."""
+    lat_r = math.radians(latitude)
+    lon_r = math.radians(longitude)
+    cos_lat = math.cos(lat_r)
+    return cos_lat * math.cos(lon_r), cos_lat * math.sin(lon_r), math.sin(lat_r)
+
+
+GEOHASH_BITS = 31
+
+
+def _spread_bits(value):
+    value &= 0xFFFFFFFF
+    value = (value | (value << 16)) & 0x0000FFFF0000FFFF
+    value = (value | (value << 8)) & 0x00FF00FF00FF00FF
+    value = (value | (value << 4)) & 0x0F0F0F0F0F0F0F0F
+    value = (value | (value << 2)) & 0x3333333333333333
+    value = (value | (value << 1)) & 0x5555555555555555
+    return value
+
+
+def _grid_cell(latitude, longitude):
+    scale = 1 << GEOHASH_BITS
+    lat_cell = min(scale - 1, int((latitude + 90) / 180 * scale))
+    lon_cell = min(scale - 1, int((longitude + 180) / 360 * scale))
+    return lat_cell, lon_cell
+
+
+def geohash(latitude, longitude):
+    """Interleave 31-bit lat/lon grid cells into a 62-bit Z-order (integer geohash) key."""
+    lat_cell, lon_cell = _grid_cell(latitude, longitude)
+    return (_spread_bits(lon_cell) << 1) | _spread_bits(lat_cell)
+
+
+def geohash_ranges(latitude, longitude, precision):
+    """Key ranges of the 3x3 block of cells at `precision` bits per axis around a point."""
+    shift = GEOHASH_BITS - precision
+    size = 1 << precision
+    lat_cell, lon_cell = _grid_cell(latitude, longitude)
+    lat_cell >>= shift
+    lon_cell >>= shift
+
+    ranges = []
+    for d_lat in (-1, 0, 1):
+        row = lat_cell + d_lat
+        if not 0 <= row < size:
+            continue
+        for d_lon in (-1, 0, 1):
+            col = (lon_cell + d_lon) % size
+            prefix = (_spread_bits(col) << 1) | _spread_bits(row)
+            ranges.append((prefix << (2 * shift), ((prefix + 1) << (2 * shift)) - 1))
+    return ranges
+
+
+class LocationCatalogQuerySet(models.QuerySet):
+    def nearest(self, latitude, longitude):
+        # On the unit sphere a larger dot product means a shorter great-circle distance.
+        x0, y0, z0 = unit_vector(latitude, longitude)
+        return self.annotate(proximity=F("x") * x0 + F("y") * y0 + F("z") * z0).order_by("-proximity")
+
+    def nearby(self, latitude, longitude, precision=8):
+        # Prune to neighbouring geohash cells with indexed range scans, then rank by distance.
+        # At the default precision a cell spans roughly 0.7 degrees of latitude.
+        cells = Q()
+        for low, high in geohash_ranges(latitude, longitude, precision):
+            cells |= Q(geohash__range=(low, high))
+        return self.filter(cells).nearest(latitude, longitude)
+
+
 class LocationCatalog(models.Model):
-    name = models.CharField(max_length=120, unique=True)
+    name = models.CharField(max_length=120)
     state = models.CharField(max_length=80, blank=True)
     latitude = models.FloatField()
     longitude = models.FloatField()
@@ -32,12 +126,105 @@ class LocationCatalog(models.Model):
     created_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Unit-sphere Cartesian coordinates, kept in sync with latitude/longitude.
+    x = models.FloatField(default=0, editable=False)
+    y = models.FloatField(default=0, editable=False)
+    z = models.FloatField(default=0, editable=False)
+    geohash = models.BigIntegerField(default=0, db_index=True, editable=False)
+
+    objects = LocationCatalogQuerySet.as_manager()
+
     class Meta:
         ordering = ["state", "name"]
+        constraints = [
+            models.UniqueConstraint(fields=["state", "name"], name="uniq_loc_state_name"),
+        ]
+        indexes = [
+            # Serves the case-insensitive city lookup in find_or_build_location,
+            # with or without the state filter.
+            models.Index(Lower("name"), "state", name="location_name_state_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name}, {self.state}"
 
+    def set_spatial_fields(self):
+        self.x, self.y, self.z = unit_vector(self.latitude, self.longitude)
+        self.geohash = geohash(self.latitude, self.longitude)
+
+    def save(self, *args, **kwargs):
+        self.set_spatial_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = set(update_fields) | {"x", "y", "z", "geohash"}
+        super().save(*args, **kwargs)
+
+
+# Numeric risk/score columns, in the column order returned by score_matrix().
+SCORE_FIELDS = (
+    "rainfall_trend",
+    "flood_history",
+    "cyclone_path_risk",
+    "drought_index",
+    "base_credit_score",
+    "ai_credit_score",
+    "esg_aligned_credit_score",
+    "climate_risk_score",
+    "adjusted_credit_score",
+    "esg_risk_score",
+    "property_risk_score",
+    "default_probability",
+)
+
+
+# Columns rendered by the dashboard application tables.
+LIST_FIELDS = (
+    "id",
+    "user",
+    "borrower_name",
+    "location_state",
+    "location_district",
+    "property_type",
+    "property_value",
+    "property_risk_score",
+    "income",
+    "loan_amount",
+    "base_credit_score",
+    "ai_credit_score",
+    "esg_aligned_credit_score",
+    "climate_risk_score",
+    "climate_risk_classification",
+    "esg_risk_score",
+    "suggested_interest_rate",
+    "default_probability",
+    "suggested_collateral_ratio",
+    "suggested_tenure_months",
+    "esg_lending_recommendation",
+    "model_algorithm",
+    "model_confidence",
+    "early_warning_message",
+    "final_decision",
+    "decision_rationale",
+    "created_at",
+)
+
+
+class ClimateCreditApplicationQuerySet(models.QuerySet):
+    def for_list(self, *extra_fields):
+        return self.only(*LIST_FIELDS, *extra_fields)
+
+    def with_user(self):
+        return self.select_related("user", "user__profile")
+
+    def stream_for_recompute(self, *fields, chunk_size=2000):
+        """Iterate rows in chunks, loading only `fields`, so memory stays flat on full-table jobs."""
+        return self.only("id", *fields).iterator(chunk_size=chunk_size)
+
+    def score_matrix(self, fields=SCORE_FIELDS):
+        """Return the selected numeric columns as an (n_rows, n_fields) float array."""
+        rows = list(self.values_list(*fields))
+        return np.asarray(rows, dtype=float).reshape(len(rows), len(fields))
+
 
 class ClimateCreditApplication(models.Model):
     ID_AADHAAR = "aadhaar"
@@ -46,6 +233,7 @@ class ClimateCreditApplication(models.Model):
         (ID_AADHAAR, "Aadhaar"),
         (ID_PAN, "PAN"),
     ]
+    VALID_ID_TYPES = frozenset(dict(ID_CHOICES))
 
     PROPERTY_HOUSE = "House"
     PROPERTY_APARTMENT = "Apartment"
@@ -57,20 +245,34 @@ class ClimateCreditApplication(models.Model):
         (PROPERTY_FARM, PROPERTY_FARM),
         (PROPERTY_COMMERCIAL, PROPERTY_COMMERCIAL),
     ]
+    VALID_PROPERTY_TYPES = frozenset(dict(PROPERTY_CHOICES))
+
+    # Ordinal codes: higher value means higher climate risk.
+    CLIMATE_LOW = 1
+    CLIMATE_MODERATE = 2
+    CLIMATE_HIGH = 3
+    CLIMATE_SEVERE = 4
+    CLIMATE_CHOICES = [
+        (CLIMATE_LOW, "Low"),
+        (CLIMATE_MODERATE, "Moderate"),
+        (CLIMATE_HIGH, "High"),
+        (CLIMATE_SEVERE, "Severe"),
+    ]
 
-    CLIMATE_LOW = "Low"
-    CLIMATE_MODERATE = "Moderate"
-    CLIMATE_HIGH = "High"
-    CLIMATE_SEVERE = "Severe"
-
-    DECISION_AUTO_APPROVE = "Auto Approve"
-    DECISION_CONDITIONAL = "Conditional Approve"
-    DECISION_REJECT = "Reject"
+    DECISION_AUTO_APPROVE = 1
+    DECISION_CONDITIONAL = 2
+    DECISION_REJECT = 3
     DECISION_CHOICES = [
-        (DECISION_AUTO_APPROVE, DECISION_AUTO_APPROVE),
-        (DECISION_CONDITIONAL, DECISION_CONDITIONAL),
-        (DECISION_REJECT, DECISION_REJECT),
+        (DECISION_AUTO_APPROVE, "Auto Approve"),
+        (DECISION_CONDITIONAL, "Conditional Approve"),
+        (DECISION_REJECT, "Reject"),
     ]
+    VALID_DECISIONS = frozenset(dict(DECISION_CHOICES))
+    DECISION_BADGES = {
+        DECISION_AUTO_APPROVE: "status-approve",
+        DECISION_CONDITIONAL: "status-conditional",
+        DECISION_REJECT: "status-reject",
+    }
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="climate_applications")
 
@@ -80,17 +282,17 @@ class ClimateCreditApplication(models.Model):
 
     property_type = models.CharField(max_length=20, choices=PROPERTY_CHOICES, default=PROPERTY_HOUSE)
     property_value = models.FloatField(default=0)
-    property_risk_score = models.PositiveIntegerField(default=0)
+    property_risk_score = models.PositiveSmallIntegerField(default=0, validators=[MaxValueValidator(100)])
 
     location_state = models.CharField(max_length=80, default="India")
-    location_district = models.CharField(max_length=80)
+    location_district = models.CharField(max_length=80, db_index=True)
     latitude = models.FloatField()
     longitude = models.FloatField()
 
     income = models.FloatField()
     base_credit_score = models.PositiveIntegerField()
-    ai_credit_score = models.PositiveIntegerField(default=0)
-    esg_aligned_credit_score = models.PositiveIntegerField(default=0)
+    ai_credit_score = models.PositiveSmallIntegerField(default=0)
+    esg_aligned_credit_score = models.PositiveSmallIntegerField(default=0)
 
     loan_amount = models.FloatField()
     is_location_valid = models.BooleanField(default=False)
@@ -100,17 +302,17 @@ class ClimateCreditApplication(models.Model):
     cyclone_path_risk = models.FloatField(default=0)
     drought_index = models.FloatField(default=0)
 
-    climate_risk_score = models.PositiveIntegerField(default=0)
-    climate_risk_classification = models.CharField(max_length=16, default=CLIMATE_LOW)
+    climate_risk_score = models.PositiveSmallIntegerField(default=0, validators=[MaxValueValidator(100)])
+    climate_risk_classification = models.PositiveSmallIntegerField(choices=CLIMATE_CHOICES, default=CLIMATE_LOW)
 
-    adjusted_credit_score = models.PositiveIntegerField(default=0)
+    adjusted_credit_score = models.PositiveSmallIntegerField(default=0)
 
     suggested_interest_rate = models.FloatField(default=0)
     suggested_collateral_ratio = models.FloatField(default=0)
-    suggested_tenure_months = models.PositiveIntegerField(default=0)
+    suggested_tenure_months = models.PositiveSmallIntegerField(default=0)
 
-    decision = models.CharField(max_length=30, choices=DECISION_CHOICES, default=DECISION_CONDITIONAL)
-    esg_risk_score = models.PositiveIntegerField(default=0)
+    decision = models.PositiveSmallIntegerField(choices=DECISION_CHOICES, default=DECISION_CONDITIONAL)
+    esg_risk_score = models.PositiveSmallIntegerField(default=0, validators=[MaxValueValidator(100)])
     default_probability = models.FloatField(default=0)
     esg_lending_recommendation = models.CharField(max_length=120, default="Standard Monitoring")
 
@@ -120,26 +322,146 @@ class ClimateCreditApplication(models.Model):
     model_algorithm = models.CharField(max_length=60, default="RandomForestRegressor")
     model_confidence = models.FloatField(default=0)
 
-    manager_override_decision = models.CharField(max_length=30, choices=DECISION_CHOICES, blank=True)
-    final_decision = models.CharField(max_length=30, choices=DECISION_CHOICES, default=DECISION_CONDITIONAL)
+    manager_override_decision = models.PositiveSmallIntegerField(choices=DECISION_CHOICES, null=True, blank=True)
+    final_decision = models.PositiveSmallIntegerField(choices=DECISION_CHOICES, default=DECISION_CONDITIONAL)
 
     decision_rationale = models.TextField(blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ClimateCreditApplicationQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["final_decision"]),
+            models.Index(fields=["climate_risk_classification"]),
+            models.Index(fields=["early_warning_flag"]),
+        ]
 
     def __str__(self):
-        return f"{self.borrower_name} - {self.final_decision}"
+        return f"{self.borrower_name} - {self.get_final_decision_display()}"
+
+    @property
+    def final_decision_badge(self):
+        return self.DECISION_BADGES.get(self.final_decision, "status-conditional")
+
+    @classmethod
+    def classify_climate_score(cls, score):
+        if score < 25:
+            return cls.CLIMATE_LOW
+        if score < 50:
+            return cls.CLIMATE_MODERATE
+        if score < 75:
+            return cls.CLIMATE_HIGH
+        return cls.CLIMATE_SEVERE
+
+    def save(self, *args, **kwargs):
+        # The classification is derived from the score at write time so reads never recompute it.
+        self.climate_risk_classification = self.classify_climate_score(self.climate_risk_score)
+        super().save(*args, **kwargs)
+
+
+SUMMARY_SUM_FIELDS = {
+    "sum_risk": "climate_risk_score",
+    "sum_default": "default_probability",
+    "sum_esg": "esg_risk_score",
+    "sum_interest": "suggested_interest_rate",
+    "sum_ai_credit": "ai_credit_score",
+    "sum_esg_credit": "esg_aligned_credit_score",
+}
+# Application columns that feed UserDashboardSummary.
+SUMMARY_SOURCE_FIELDS = frozenset(["final_decision", "early_warning_flag", *SUMMARY_SUM_FIELDS.values()])
+
+
+class UserDashboardSummary(models.Model):
+    # Sums rather than averages are stored so manager views can add rows across officers.
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="dashboard_summary")
+    total_apps = models.PositiveIntegerField(default=0)
+    approved = models.PositiveIntegerField(default=0)
+    conditional = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    warnings = models.PositiveIntegerField(default=0)
+    sum_risk = models.FloatField(default=0)
+    sum_default = models.FloatField(default=0)
+    sum_esg = models.FloatField(default=0)
+    sum_interest = models.FloatField(default=0)
+    sum_ai_credit = models.FloatField(default=0)
+    sum_esg_credit = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username} - {self.total_apps} applications"
+
+    @classmethod
+    def contribution(cls, values):
+        """The summary counters one application adds, from a mapping of its SUMMARY_SOURCE_FIELDS."""
+        decision = values["final_decision"]
+        return {
+            "total_apps": 1,
+            "approved": int(decision == ClimateCreditApplication.DECISION_AUTO_APPROVE),
+            "conditional": int(decision == ClimateCreditApplication.DECISION_CONDITIONAL),
+            "rejected": int(decision == ClimateCreditApplication.DECISION_REJECT),
+            "warnings": int(bool(values["early_warning_flag"])),
+            **{key: values[field] or 0 for key, field in SUMMARY_SUM_FIELDS.items()},
+        }
+
+    @classmethod
+    def contribution_of(cls, application):
+        # get_prep_value applies the same coercion the INSERT/UPDATE did (e.g. int() for the small-integer scores).
+        meta = ClimateCreditApplication._meta
+        return cls.contribution(
+            {field: meta.get_field(field).get_prep_value(getattr(application, field)) for field in SUMMARY_SOURCE_FIELDS}
+        )
+
+    @classmethod
+    def apply_delta(cls, user_id, delta, create=True):
+        """Add delta to the user's counters in one UPDATE, so concurrent writers never overwrite each other."""
+        changes = {key: F(key) + value for key, value in delta.items() if value}
+        if not changes:
+            return
+        rows = cls.objects.filter(user_id=user_id)
+        if not rows.update(updated_at=Now(), **changes) and create:
+            cls.objects.get_or_create(user_id=user_id)
+            rows.update(updated_at=Now(), **changes)
+
+    @classmethod
+    def refresh(cls, user_id):
+        """Recompute the user's row from scratch; for bulk writes that skip the model signals."""
+        with transaction.atomic():
+            # Lock the row first so the aggregate sees every delta committed before it.
+            cls.objects.get_or_create(user_id=user_id)
+            list(cls.objects.select_for_update().filter(user_id=user_id))
+            cls._recompute(user_id)
+
+    @classmethod
+    def _recompute(cls, user_id):
+        metrics = ClimateCreditApplication.objects.filter(user_id=user_id).aggregate(
+            total_apps=Count("id"),
+            approved=Count("id", filter=Q(final_decision=ClimateCreditApplication.DECISION_AUTO_APPROVE)),
+            conditional=Count("id", filter=Q(final_decision=ClimateCreditApplication.DECISION_CONDITIONAL)),
+            rejected=Count("id", filter=Q(final_decision=ClimateCreditApplication.DECISION_REJECT)),
+            warnings=Count("id", filter=Q(early_warning_flag=True)),
+            **{key: Sum(field) for key, field in SUMMARY_SUM_FIELDS.items()},
+        )
+        cls.objects.filter(user_id=user_id).update(
+            updated_at=Now(),
+            **{key: value or 0 for key, value in metrics.items()},
+        )
+
+
+class AuditLogQuerySet(models.QuerySet):
+    def for_app_view(self):
+        return self.select_related("user", "application")
 
 
 class AuditLog(models.Model):
-    ACTION_CREATE = "create"
-    ACTION_OVERRIDE = "override"
-    ACTION_FINAL_CONFIRM = "final_confirm"
-    ACTION_DELETE = "delete"
+    ACTION_CREATE = 1
+    ACTION_OVERRIDE = 2
+    ACTION_FINAL_CONFIRM = 3
+    ACTION_DELETE = 4
 
     ACTION_CHOICES = [
         (ACTION_CREATE, "Create Application"),
@@ -148,27 +470,42 @@ class AuditLog(models.Model):
         (ACTION_DELETE, "Delete Application"),
     ]
 
-    application = models.ForeignKey(ClimateCreditApplication, on_delete=models.CASCADE, related_name="audit_logs")
+    # Deletes cascade in Django; dropping the database FK spares bulk purges the per-row trigger checks.
+    application = models.ForeignKey(ClimateCreditApplication, on_delete=models.CASCADE, related_name="audit_logs", db_constraint=False)
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
-    action = models.CharField(max_length=40, choices=ACTION_CHOICES)
-    decision = models.CharField(max_length=30, blank=True)
-    risk_factors = models.TextField(blank=True)
+    action = models.PositiveSmallIntegerField(choices=ACTION_CHOICES)
+    decision = models.PositiveSmallIntegerField(choices=ClimateCreditApplication.DECISION_CHOICES, null=True, blank=True)
+    risk_factors = models.JSONField(default=dict, blank=True)
     details = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = AuditLogQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["application", "-created_at"]),
+        ]
 
 
 class PlaceHistory(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     place_name = models.CharField(max_length=255)
-    latitude = models.FloatField()
-    longitude = models.FloatField()
+    latitude = models.DecimalField(max_digits=8, decimal_places=4)
+    longitude = models.DecimalField(max_digits=8, decimal_places=4)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Migration 0020 rebuilds this as a covering index on PostgreSQL so the list and
+            # the trim are index-only there. The unique constraint below already indexes
+            # (user, latitude, longitude).
+            models.Index(fields=["user", "-created_at"], name="placehist_user_created_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["user", "latitude", "longitude"], name="uniq_user_place"),
+        ]
 
     def __str__(self):
         return f"{self.place_name} ({self.latitude}, {self.longitude})"
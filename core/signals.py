@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.db import connections
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .caching import invalidate_location_lookup
+from .models import (
+    SUMMARY_SOURCE_FIELDS,
+    ClimateCreditApplication,
+    LocationCatalog,
+    UserDashboardSummary,
+    UserProfile,
+    role_cache_key,
+)
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+def clear_role_cache(sender, instance, **kwargs):
+    cache.delete(role_cache_key(instance.user_id))
+
+
+@receiver(pre_save, sender=ClimateCreditApplication)
+def remember_summary_contribution(sender, instance, update_fields=None, **kwargs):
+    # Overrides change final_decision, so the stored row's counters are read before the UPDATE.
+    if instance._state.adding or (update_fields is not None and SUMMARY_SOURCE_FIELDS.isdisjoint(update_fields)):
+        return
+    values = sender.objects.filter(pk=instance.pk).values(*SUMMARY_SOURCE_FIELDS).first()
+    instance._summary_before = UserDashboardSummary.contribution(values) if values else None
+
+
+@receiver(post_save, sender=ClimateCreditApplication)
+def add_summary_contribution(sender, instance, created, **kwargs):
+    before = None if created else instance.__dict__.pop("_summary_before", False)
+    if before is False:
+        return
+    after = UserDashboardSummary.contribution_of(instance)
+    if before:
+        after = {key: value - before[key] for key, value in after.items()}
+    UserDashboardSummary.apply_delta(instance.user_id, after)
+
+
+@receiver(pre_delete, sender=ClimateCreditApplication)
+def remove_summary_contribution(sender, instance, **kwargs):
+    # pre_delete runs inside the delete transaction while deferred fields can still be loaded.
+    contribution = UserDashboardSummary.contribution_of(instance)
+    UserDashboardSummary.apply_delta(instance.user_id, {key: -value for key, value in contribution.items()}, create=False)
+
+
+@receiver([post_save, post_delete], sender=LocationCatalog)
+def clear_location_lookup(sender, **kwargs):
+    invalidate_location_lookup()
+
+
+@receiver(post_migrate)
+def seed_location_catalog(sender, app_config, using, **kwargs):
+    if app_config.label != "core":
+        return
+    # Seeding uses the current models, so skip it while the schema is rolled back or partially migrated.
+    executor = MigrationExecutor(connections[using])
+    if executor.migration_plan(executor.loader.graph.leaf_nodes()):
+        return
+    from .views import seed_default_locations
+
+    seed_default_locations(using=using)
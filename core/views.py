@@ -1,21 +1,47 @@
+import hashlib
 import json
+import math
+import os
 import re
+import threading
+from decimal import Decimal, InvalidOperation
 from functools import wraps
+from pathlib import Path
+from typing import NamedTuple
 
+import joblib
 import numpy as np
+import orjson
 import requests
+import sklearn
+from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from django.db import IntegrityError
-from django.db.models import Avg, Count
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Sum
+from django.db.models.functions import Lower
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.cache import never_cache
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 from sklearn.ensemble import RandomForestRegressor
 
-from .models import AuditLog, ClimateCreditApplication, LocationCatalog, PlaceHistory, UserProfile
+from .caching import (
+    LOCATION_LOOKUP_CACHE_TIMEOUT,
+    invalidate_location_lookup,
+    invalidate_place_history,
+    location_lookup_cache_key,
+    location_lookup_version,
+    place_history_cache_key,
+    place_history_version,
+)
+from .models import SUMMARY_SUM_FIELDS, AuditLog, ClimateCreditApplication, LocationCatalog, PlaceHistory, UserDashboardSummary, UserProfile, role_for
+
+
+CLIMATE_LABELS = dict(ClimateCreditApplication.CLIMATE_CHOICES)
+DECISION_LABELS = dict(ClimateCreditApplication.DECISION_CHOICES)
 
 
 STATE_CITY_DATA = {
@@ -86,64 +112,120 @@ def get_location_from_nominatim(place_name):
 
 
 _RF_MODEL = None
+_RF_LOCK = threading.Lock()
+# The target is a smooth linear formula, so a small, shallow forest fits it well enough
+# while keeping each prediction to a few hundred node visits.
+RF_PARAMS = {
+    "n_estimators": 60,
+    "max_depth": 6,
+    "min_samples_leaf": 3,
+    "n_jobs": 1,
+    "random_state": 42,
+}
+# Sampling range of each training feature, in predict_default_probability_rf argument order.
+RF_FEATURE_RANGES = (
+    (10, 95),  # rainfall
+    (5, 95),  # flood
+    (0, 90),  # cyclone
+    (5, 95),  # drought
+    (180000, 3500000),  # income
+    (100000, 15000000),  # loan_amount
+    (300, 900),  # credit_score
+    (250000, 25000000),  # property_value
+)
 
 
 def get_or_create_profile(user):
+    # Reuse the profile already cached on this user object (backend join or an earlier call).
+    if User.profile.is_cached(user):
+        try:
+            return user.profile
+        except UserProfile.DoesNotExist:
+            pass
+
     profile, created = UserProfile.objects.get_or_create(user=user)
     # Auto-assign default ROLE_OFFICER to new users
     if created and not profile.role:
         profile.role = UserProfile.ROLE_OFFICER
         profile.save(update_fields=["role"])
+    user.profile = profile
     return profile
 
 
+def clamp(value, low, high):
+    # Plain min/max; np.clip costs more in array wrapping than the arithmetic it guards on scalars.
+    return min(high, max(low, value))
+
+
 def derive_climate_profile(lat, lon):
     coastal_factor = max(0.0, 1 - min(abs(lon - 80) / 18, 1))
     south_factor = max(0.0, 1 - min(abs(lat - 12) / 18, 1))
     west_dry = max(0.0, 1 - min(abs(lon - 72) / 12, 1))
 
-    rainfall = float(np.clip(30 + 35 * south_factor + 18 * coastal_factor, 20, 95))
-    flood = float(np.clip(18 + 42 * coastal_factor + 20 * south_factor, 10, 95))
-    cyclone = float(np.clip(10 + 55 * coastal_factor, 5, 95))
-    drought = float(np.clip(20 + 50 * west_dry + 12 * (1 - south_factor), 10, 95))
+    rainfall = clamp(30 + 35 * south_factor + 18 * coastal_factor, 20.0, 95.0)
+    flood = clamp(18 + 42 * coastal_factor + 20 * south_factor, 10.0, 95.0)
+    cyclone = clamp(10 + 55 * coastal_factor, 5.0, 95.0)
+    drought = clamp(20 + 50 * west_dry + 12 * (1 - south_factor), 10.0, 95.0)
     return rainfall, flood, cyclone, drought
 
 
-def seed_default_locations():
-    for state, cities in STATE_CITY_DATA.items():
-        for city in cities:
-            rainfall, flood, cyclone, drought = derive_climate_profile(city["lat"], city["lon"])
-            LocationCatalog.objects.get_or_create(
-                name=city["name"],
-                defaults={
-                    "state": state,
-                    "latitude": city["lat"],
-                    "longitude": city["lon"],
-                    "rainfall_index": round(rainfall, 2),
-                    "flood_index": round(flood, 2),
-                    "cyclone_index": round(cyclone, 2),
-                    "drought_index": round(drought, 2),
-                },
-            )
+def derive_climate_profiles(lats, lons):
+    # Array form of derive_climate_profile for scoring many coordinates in one pass.
+    coastal_factor = 1 - np.minimum(np.abs(lons - 80) / 18, 1)
+    south_factor = 1 - np.minimum(np.abs(lats - 12) / 18, 1)
+    west_dry = 1 - np.minimum(np.abs(lons - 72) / 12, 1)
 
+    rainfall = np.clip(30 + 35 * south_factor + 18 * coastal_factor, 20, 95)
+    flood = np.clip(18 + 42 * coastal_factor + 20 * south_factor, 10, 95)
+    cyclone = np.clip(10 + 55 * coastal_factor, 5, 95)
+    drought = np.clip(20 + 50 * west_dry + 12 * (1 - south_factor), 10, 95)
+    return rainfall, flood, cyclone, drought
 
-def get_rf_model():
-    global _RF_MODEL
-    if _RF_MODEL is not None:
-        return _RF_MODEL
 
-    rng = np.random.default_rng(42)
-    n = 1800
-    rainfall = rng.uniform(10, 95, n)
-    flood = rng.uniform(5, 95, n)
-    cyclone = rng.uniform(0, 90, n)
-    drought = rng.uniform(5, 95, n)
-    income = rng.uniform(180000, 3500000, n)
-    loan_amount = rng.uniform(100000, 15000000, n)
-    credit_score = rng.uniform(300, 900, n)
-    property_value = rng.uniform(250000, 25000000, n)
-
-    target = (
+# STATE_CITY_DATA flattened once at import into parallel arrays, with climate indices precomputed.
+_CITY_STATES = tuple(state for state, cities in STATE_CITY_DATA.items() for _ in cities)
+_CITY_NAMES = tuple(city["name"] for cities in STATE_CITY_DATA.values() for city in cities)
+_CITY_LATS = np.array([city["lat"] for cities in STATE_CITY_DATA.values() for city in cities])
+_CITY_LONS = np.array([city["lon"] for cities in STATE_CITY_DATA.values() for city in cities])
+_RAIN, _FLOOD, _CYCLONE, _DROUGHT = (
+    np.array([round(value, 2) for value in index.tolist()]) for index in derive_climate_profiles(_CITY_LATS, _CITY_LONS)
+)
+
+
+def seed_default_locations(using="default"):
+    locations = []
+    for state, name, lat, lon, rainfall, flood, cyclone, drought in zip(
+        _CITY_STATES,
+        _CITY_NAMES,
+        _CITY_LATS.tolist(),
+        _CITY_LONS.tolist(),
+        _RAIN.tolist(),
+        _FLOOD.tolist(),
+        _CYCLONE.tolist(),
+        _DROUGHT.tolist(),
+    ):
+        location = LocationCatalog(
+            name=name,
+            state=state,
+            latitude=lat,
+            longitude=lon,
+            rainfall_index=rainfall,
+            flood_index=flood,
+            cyclone_index=cyclone,
+            drought_index=drought,
+        )
+        # bulk_create skips save(), so the derived spatial columns are filled here.
+        location.set_spatial_fields()
+        locations.append(location)
+
+    LocationCatalog.objects.using(using).bulk_create(locations, ignore_conflicts=True, batch_size=100)
+    # bulk_create sends no post_save, so the apply-page lookup is invalidated here.
+    invalidate_location_lookup()
+
+
+def default_probability_formula(rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value):
+    # Works on scalars and arrays alike; the RandomForest is trained to reproduce this target.
+    return (
         0.24 * rainfall
         + 0.33 * flood
         + 0.17 * cyclone
@@ -152,22 +234,119 @@ def get_rf_model():
         + 0.03 * (740 - credit_score)
         + 0.0000002 * (loan_amount - property_value)
     )
-    target = np.clip(target, 1, 95)
-
-    features = np.column_stack([rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value])
-    model = RandomForestRegressor(
-        n_estimators=240,
-        max_depth=11,
-        min_samples_leaf=3,
-        random_state=42,
-    )
+
+
+def model_algorithm_name():
+    return "RandomForestRegressor" if settings.RF_MODEL_ENABLED else "Climate Risk Formula"
+
+
+def rf_model_cache_path():
+    # Keyed by sklearn version and hyperparameters so a stale pickle is never loaded.
+    key = {"params": RF_PARAMS, "ranges": RF_FEATURE_RANGES, "dtype": "float32"}
+    digest = hashlib.md5(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+    return Path(settings.RF_MODEL_CACHE_DIR) / f"rf_model-{sklearn.__version__}-{digest}.joblib"
+
+
+def train_rf_model():
+    rng = np.random.default_rng(42)
+    n = 1800
+    # One C-contiguous float32 block, the layout the tree builder uses internally.
+    features = np.empty((n, 8), dtype=np.float32)
+    for column, (low, high) in enumerate(RF_FEATURE_RANGES):
+        features[:, column] = rng.uniform(low, high, n)
+
+    target = np.clip(default_probability_formula(*features.T), 1, 95)
+
+    model = RandomForestRegressor(**RF_PARAMS)
     model.fit(features, target)
-    _RF_MODEL = model
     return model
 
 
+def get_rf_model():
+    global _RF_MODEL
+    if _RF_MODEL is not None:
+        return _RF_MODEL
+
+    with _RF_LOCK:
+        if _RF_MODEL is not None:
+            return _RF_MODEL
+
+        cache_path = rf_model_cache_path()
+        if cache_path.exists():
+            model = joblib.load(cache_path, mmap_mode="r")
+        else:
+            model = train_rf_model()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so another worker never loads a half-written file.
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            joblib.dump(model, tmp_path)
+            os.replace(tmp_path, cache_path)
+        _RF_MODEL = model
+    return _RF_MODEL
+
+
+class CompiledForest:
+    """Single-row inference over a fitted forest's trees packed into dense arrays.
+
+    Every tree advances one level per step, so a prediction is max_depth
+    vectorized lookups instead of a sklearn predict() call with its input
+    validation and joblib dispatch.
+    """
+
+    def __init__(self, model):
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        width = max(tree.node_count for tree in trees)
+        shape = (len(trees), width)
+        self.left = np.zeros(shape, dtype=np.intp)
+        self.right = np.zeros(shape, dtype=np.intp)
+        self.feature = np.full(shape, -1, dtype=np.intp)
+        self.threshold = np.zeros(shape, dtype=np.float64)
+        self.value = np.zeros(shape, dtype=np.float64)
+        for index, tree in enumerate(trees):
+            count = tree.node_count
+            self.left[index, :count] = tree.children_left
+            self.right[index, :count] = tree.children_right
+            self.feature[index, :count] = tree.feature
+            self.threshold[index, :count] = tree.threshold
+            self.value[index, :count] = tree.value[:, 0, 0]
+        # Leaves point back at themselves, so finished trees stay put while deeper ones advance.
+        leaves = self.left < 0
+        self.left[leaves] = self.right[leaves] = np.nonzero(leaves)[1]
+        self.feature[leaves] = 0
+        self.rows = np.arange(len(trees))
+        self.depth = max(tree.max_depth for tree in trees)
+
+    def predict_one(self, features):
+        features = np.asarray(features, dtype=np.float32)
+        nodes = np.zeros(len(self.rows), dtype=np.intp)
+        for _ in range(self.depth):
+            go_left = features[self.feature[self.rows, nodes]] <= self.threshold[self.rows, nodes]
+            nodes = np.where(go_left, self.left[self.rows, nodes], self.right[self.rows, nodes])
+        return float(self.value[self.rows, nodes].mean())
+
+
+_RF_PREDICTOR = None
+
+
+def get_rf_predictor():
+    global _RF_PREDICTOR
+    if _RF_PREDICTOR is None:
+        _RF_PREDICTOR = CompiledForest(get_rf_model())
+    return _RF_PREDICTOR
+
+
+def user_role(user):
+    # Session users arrive with the profile joined by ProfileModelBackend, so no query is needed.
+    if User.profile.is_cached(user):
+        try:
+            return user.profile.role
+        except UserProfile.DoesNotExist:
+            pass
+    return role_for(user.pk)
+
+
 def is_authorized_role(user):
-    role = get_or_create_profile(user).role
+    role = user_role(user)
     return role in {UserProfile.ROLE_OFFICER, UserProfile.ROLE_MANAGER, UserProfile.ROLE_AUDITOR}
 
 
@@ -177,7 +356,7 @@ def role_required(allowed_roles):
         def wrapped(request, *args, **kwargs):
             if not request.user.is_authenticated:
                 return redirect("login")
-            role = get_or_create_profile(request.user).role
+            role = user_role(request.user)
             if role not in allowed_roles:
                 return render(request, "unauthorized.html", status=403)
             return view_func(request, *args, **kwargs)
@@ -187,40 +366,33 @@ def role_required(allowed_roles):
     return decorator
 
 
+PAN_RE = re.compile(r"[A-Z]{5}\d{4}[A-Z]")
+
+
 def is_valid_aadhaar(value):
-    return bool(re.fullmatch(r"\d{12}", value))
+    return len(value) == 12 and value.isascii() and value.isdigit()
 
 
 def is_valid_pan(value):
-    return bool(re.fullmatch(r"[A-Z]{5}\d{4}[A-Z]", value))
+    return PAN_RE.fullmatch(value) is not None
 
 
 def is_within_india(lat, lon):
     return 6.0 <= lat <= 38.5 and 68.0 <= lon <= 97.5
 
 
-def find_or_create_location(state, city, lat, lon, save_custom, user):
-    location = LocationCatalog.objects.filter(name__iexact=city).first()
+def find_or_build_location(state, city, lat, lon, save_custom, user):
+    """Return (location, is_new); a new custom location comes back unsaved so the caller can save it in its own transaction."""
+    # Names are only unique per state, so a known state must match too.
+    candidates = LocationCatalog.objects.annotate(name_lower=Lower("name")).filter(name_lower=city.lower())
+    if state:
+        candidates = candidates.filter(state=state)
+    location = candidates.first()
     if location:
         return location, False
 
     rainfall, flood, cyclone, drought = derive_climate_profile(lat, lon)
-    if save_custom:
-        location = LocationCatalog.objects.create(
-            name=city,
-            state=state or "Custom",
-            latitude=lat,
-            longitude=lon,
-            rainfall_index=round(rainfall, 2),
-            flood_index=round(flood, 2),
-            cyclone_index=round(cyclone, 2),
-            drought_index=round(drought, 2),
-            is_custom=True,
-            created_by=user,
-        )
-        return location, True
-
-    return LocationCatalog(
+    location = LocationCatalog(
         name=city,
         state=state or "India",
         latitude=lat,
@@ -229,37 +401,52 @@ def find_or_create_location(state, city, lat, lon, save_custom, user):
         flood_index=round(flood, 2),
         cyclone_index=round(cyclone, 2),
         drought_index=round(drought, 2),
-    ), False
+    )
+    if not save_custom:
+        return location, False
 
+    location.state = state or "Custom"
+    location.is_custom = True
+    location.created_by = user
+    return location, True
 
-def aggregate_climate_data(location, income, loan_amount):
+
+def aggregate_climate_data(rainfall_index, flood_index, cyclone_index, drought_index, income, loan_amount):
     exposure = min(20.0, (loan_amount / max(income, 1)) * 1.45)
-    rainfall = float(np.clip(location.rainfall_index + exposure * 0.9, 0, 100))
-    flood = float(np.clip(location.flood_index + exposure * 1.1, 0, 100))
-    cyclone = float(np.clip(location.cyclone_index + exposure * 0.8, 0, 100))
-    drought = float(np.clip(location.drought_index + exposure * 0.75, 0, 100))
+    rainfall = clamp(rainfall_index + exposure * 0.9, 0.0, 100.0)
+    flood = clamp(flood_index + exposure * 1.1, 0.0, 100.0)
+    cyclone = clamp(cyclone_index + exposure * 0.8, 0.0, 100.0)
+    drought = clamp(drought_index + exposure * 0.75, 0.0, 100.0)
     return rainfall, flood, cyclone, drought
 
 
 def predict_default_probability_rf(rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value):
-    model = get_rf_model()
-    features = np.array([[rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value]], dtype=float)
-    pred = float(model.predict(features)[0])
-    return round(float(np.clip(pred, 1, 95)), 2)
+    if settings.RF_MODEL_ENABLED:
+        pred = get_rf_predictor().predict_one(
+            (rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value)
+        )
+    else:
+        pred = default_probability_formula(
+            rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value
+        )
+    return round(clamp(float(pred), 1.0, 95.0), 2)
+
+
+PROPERTY_RISK_FACTORS = {
+    ClimateCreditApplication.PROPERTY_HOUSE: 1.0,
+    ClimateCreditApplication.PROPERTY_APARTMENT: 0.85,
+    ClimateCreditApplication.PROPERTY_FARM: 1.25,
+    ClimateCreditApplication.PROPERTY_COMMERCIAL: 1.1,
+}
 
 
 def property_risk(property_type, property_value, loan_amount, flood, cyclone):
-    property_factor = {
-        ClimateCreditApplication.PROPERTY_HOUSE: 1.0,
-        ClimateCreditApplication.PROPERTY_APARTMENT: 0.85,
-        ClimateCreditApplication.PROPERTY_FARM: 1.25,
-        ClimateCreditApplication.PROPERTY_COMMERCIAL: 1.1,
-    }.get(property_type, 1.0)
+    property_factor = PROPERTY_RISK_FACTORS.get(property_type, 1.0)
 
     ltv = (loan_amount / max(property_value, 1)) * 100
     score = (0.4 * ltv) + (0.35 * flood) + (0.25 * cyclone)
     score *= property_factor
-    return int(np.clip(round(score), 0, 100))
+    return clamp(round(score), 0, 100)
 
 
 def climate_analytics(rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value):
@@ -267,34 +454,26 @@ def climate_analytics(rainfall, flood, cyclone, drought, income, loan_amount, cr
         rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value
     )
 
-    base_climate_score = round(float(np.clip(
+    base_climate_score = round(clamp(
         (0.26 * rainfall) + (0.34 * flood) + (0.19 * cyclone) + (0.21 * drought),
-        0,
-        100,
-    )))
-
-    adjusted_climate_score = round(float(np.clip(0.58 * base_climate_score + 0.42 * default_prob, 0, 100)))
-
-    if adjusted_climate_score < 25:
-        level = ClimateCreditApplication.CLIMATE_LOW
-    elif adjusted_climate_score < 50:
-        level = ClimateCreditApplication.CLIMATE_MODERATE
-    elif adjusted_climate_score < 75:
-        level = ClimateCreditApplication.CLIMATE_HIGH
-    else:
-        level = ClimateCreditApplication.CLIMATE_SEVERE
+        0.0,
+        100.0,
+    ))
+
+    adjusted_climate_score = round(clamp(0.58 * base_climate_score + 0.42 * default_prob, 0.0, 100.0))
+    level = ClimateCreditApplication.classify_climate_score(adjusted_climate_score)
 
-    confidence = round(float(np.clip(89 - (abs(base_climate_score - default_prob) * 0.32), 56, 96)), 2)
+    confidence = round(clamp(89 - (abs(base_climate_score - default_prob) * 0.32), 56.0, 96.0), 2)
     return adjusted_climate_score, level, default_prob, confidence
 
 
 def ai_credit_score(base_credit_score, climate_score, default_probability, property_risk_score):
     score = base_credit_score - (0.45 * climate_score) - (0.35 * default_probability) - (0.2 * property_risk_score)
-    return int(np.clip(round(score), 300, 900))
+    return clamp(round(score), 300, 900)
 
 
 def esg_credit_score(ai_credit, esg_risk):
-    return int(np.clip(round(ai_credit - (0.4 * esg_risk)), 300, 900))
+    return clamp(round(ai_credit - (0.4 * esg_risk)), 300, 900)
 
 
 def risk_based_pricing(adjusted_credit_score, climate_score, default_probability, requested_tenure):
@@ -306,7 +485,7 @@ def risk_based_pricing(adjusted_credit_score, climate_score, default_probability
 
 def esg_score_from_risk(climate_score, flood, drought, property_risk_score):
     esg = (climate_score * 0.58) + (flood * 0.16) + (drought * 0.16) + (property_risk_score * 0.10)
-    return int(np.clip(round(esg), 0, 100))
+    return clamp(round(esg), 0, 100)
 
 
 def esg_recommendation(esg_score):
@@ -321,49 +500,142 @@ def infer_credit_score_from_risk(rainfall, flood, cyclone, drought, loan_amount,
     climate_risk = (0.22 * rainfall) + (0.28 * flood) + (0.22 * cyclone) + (0.18 * drought)
     ltv = loan_amount / max(property_value, 1)
     score = 760 - (climate_risk * 0.35) - (property_risk_score * 0.45) - (ltv * 18)
-    return int(np.clip(round(score), 300, 900))
+    return clamp(round(score), 300, 900)
+
+
+# Indexed by blocked * 3 + score tier, where blocked means high climate level or default
+# probability above 50% and the score tier counts the 600/750 thresholds cleared.
+_DECISION_LUT = (
+    ClimateCreditApplication.DECISION_REJECT,
+    ClimateCreditApplication.DECISION_CONDITIONAL,
+    ClimateCreditApplication.DECISION_AUTO_APPROVE,
+    ClimateCreditApplication.DECISION_REJECT,
+    ClimateCreditApplication.DECISION_REJECT,
+    ClimateCreditApplication.DECISION_REJECT,
+)
 
 
 def decision_engine(adjusted_credit_score, climate_level, loan_amount, default_probability):
-    if climate_level in {ClimateCreditApplication.CLIMATE_HIGH, ClimateCreditApplication.CLIMATE_SEVERE}:
-        return ClimateCreditApplication.DECISION_REJECT
+    blocked = (climate_level >= ClimateCreditApplication.CLIMATE_HIGH) | (default_probability > 50)
+    score_tier = (adjusted_credit_score >= 600) + (adjusted_credit_score >= 750)
+    return _DECISION_LUT[blocked * 3 + score_tier]
 
-    if default_probability > 50:
-        return ClimateCreditApplication.DECISION_REJECT
 
-    if adjusted_credit_score >= 750:
-        return ClimateCreditApplication.DECISION_AUTO_APPROVE
+_CREDIT_MESSAGES = ("Low credit score – High risk", "Moderate score – Medium risk", "Good score – Low risk")
+_DEFAULT_MESSAGES = (None, "Warning: Closely monitor repayment and climate events", "Critical Alert: Immediate portfolio review required")
 
-    if adjusted_credit_score >= 600:
-        return ClimateCreditApplication.DECISION_CONDITIONAL
 
-    return ClimateCreditApplication.DECISION_REJECT
+def _build_warning_lut():
+    table = []
+    for credit_tier in range(3):
+        for default_tier in range(3):
+            for climate_high in (False, True):
+                for esg_high in (False, True):
+                    messages = [_CREDIT_MESSAGES[credit_tier], _DEFAULT_MESSAGES[default_tier]]
+                    if climate_high:
+                        messages.append("High climate risk detected")
+                    if esg_high:
+                        messages.append("ESG compliance concerns")
+                    has_warning = credit_tier < 2 or default_tier > 0 or climate_high or esg_high
+                    table.append((has_warning, " | ".join(message for message in messages if message)))
+    return tuple(table)
 
 
-def early_warning(default_probability, climate_score, esg_score, credit_score):
-    messages = []
+# Indexed by ((credit tier * 3 + default tier) * 2 + climate high) * 2 + ESG high.
+_WARNING_LUT = _build_warning_lut()
 
-    if credit_score < 600:
-        messages.append("Low credit score – High risk")
-    elif credit_score < 750:
-        messages.append("Moderate score – Medium risk")
-    else:
-        messages.append("Good score – Low risk")
 
-    if default_probability >= 55:
-        messages.append("Critical Alert: Immediate portfolio review required")
-    elif default_probability >= 40:
-        messages.append("Warning: Closely monitor repayment and climate events")
+def early_warning(default_probability, climate_score, esg_score, credit_score):
+    credit_tier = (credit_score >= 600) + (credit_score >= 750)
+    default_tier = (default_probability >= 40) + (default_probability >= 55)
+    index = ((credit_tier * 3 + default_tier) * 2 + (climate_score >= 75)) * 2 + (esg_score >= 65)
+    return _WARNING_LUT[index]
 
-    if climate_score >= 75:
-        messages.append("High climate risk detected")
-    if esg_score >= 65:
-        messages.append("ESG compliance concerns")
 
-    warning_message = " | ".join(messages) if messages else ""
-    has_warning = credit_score < 750 or default_probability >= 40 or climate_score >= 75 or esg_score >= 65
+def score_applications_batch(rows):
+    """Vectorized realtime scoring over many applications.
 
-    return has_warning, warning_message
+    Mirrors the scalar pipeline in realtime_decision_api step for step, one
+    NumPy expression per helper across all rows.
+    """
+    income, credit_score, loan_amount, property_value, tenure_months, property_type, lat, lon = zip(*rows)
+    income = np.array(income, dtype=float)
+    credit_score = np.array(credit_score, dtype=float)
+    loan_amount = np.array(loan_amount, dtype=float)
+    property_value = np.array(property_value, dtype=float)
+    tenure_months = np.array(tenure_months, dtype=float)
+
+    # derive_climate_profile + aggregate_climate_data
+    rainfall, flood, cyclone, drought = derive_climate_profiles(np.array(lat, dtype=float), np.array(lon, dtype=float))
+    exposure = np.minimum(20.0, (loan_amount / np.maximum(income, 1)) * 1.45)
+    rainfall = np.clip(rainfall + exposure * 0.9, 0, 100)
+    flood = np.clip(flood + exposure * 1.1, 0, 100)
+    cyclone = np.clip(cyclone + exposure * 0.8, 0, 100)
+    drought = np.clip(drought + exposure * 0.75, 0, 100)
+
+    # property_risk
+    property_factor = np.array([PROPERTY_RISK_FACTORS.get(kind, 1.0) for kind in property_type])
+    ltv = loan_amount / np.maximum(property_value, 1)
+    property_risk_score = np.clip(np.rint(((0.4 * ltv * 100) + (0.35 * flood) + (0.25 * cyclone)) * property_factor), 0, 100)
+
+    # infer_credit_score_from_risk for missing or implausible scores
+    climate_risk = (0.22 * rainfall) + (0.28 * flood) + (0.22 * cyclone) + (0.18 * drought)
+    inferred = np.clip(np.rint(760 - (climate_risk * 0.35) - (property_risk_score * 0.45) - (ltv * 18)), 300, 900)
+    credit_score = np.where(credit_score < 300, inferred, credit_score)
+
+    # climate_analytics
+    if settings.RF_MODEL_ENABLED:
+        features = np.column_stack(
+            [rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value]
+        ).astype(np.float32)
+        pred = get_rf_model().predict(features)
+    else:
+        pred = default_probability_formula(
+            rainfall, flood, cyclone, drought, income, loan_amount, credit_score, property_value
+        )
+    # Python's round() is correctly rounded where np.round is not, and the batch must match the scalar path exactly.
+    default_probability = np.array([round(value, 2) for value in np.clip(pred, 1, 95).tolist()])
+    base_climate_score = np.rint(np.clip((0.26 * rainfall) + (0.34 * flood) + (0.19 * cyclone) + (0.21 * drought), 0, 100))
+    climate_score = np.rint(np.clip(0.58 * base_climate_score + 0.42 * default_probability, 0, 100))
+    climate_level = ClimateCreditApplication.CLIMATE_LOW + (climate_score >= 25) + (climate_score >= 50) + (climate_score >= 75)
+    confidence = np.clip(89 - (np.abs(base_climate_score - default_probability) * 0.32), 56, 96)
+
+    # ai_credit_score, esg_score_from_risk, esg_credit_score
+    ai_credit = np.clip(np.rint(credit_score - (0.45 * climate_score) - (0.35 * default_probability) - (0.2 * property_risk_score)), 300, 900)
+    esg_score = np.clip(np.rint((climate_score * 0.58) + (flood * 0.16) + (drought * 0.16) + (property_risk_score * 0.10)), 0, 100)
+    esg_credit = np.clip(np.rint(ai_credit - (0.4 * esg_score)), 300, 900)
+
+    # risk_based_pricing
+    interest_rate = 7.9 + (climate_score * 0.07) + (default_probability * 0.03) + np.maximum(0, (700 - ai_credit) * 0.01)
+    collateral_ratio = np.minimum(85, 18 + (climate_score * 0.55) + (default_probability * 0.2))
+    suggested_tenure = np.clip(np.trunc(tenure_months - (climate_score * 0.25) - (default_probability * 0.1)), 12, 84)
+
+    # decision_engine and early_warning, through the same lookup tables
+    blocked = (climate_level >= ClimateCreditApplication.CLIMATE_HIGH) | (default_probability > 50)
+    score_tier = (ai_credit >= 600).astype(int) + (ai_credit >= 750)
+    decisions = np.asarray(_DECISION_LUT)[blocked * 3 + score_tier]
+    default_tier = (default_probability >= 40).astype(int) + (default_probability >= 55)
+    warning_index = ((score_tier * 3 + default_tier) * 2 + (climate_score >= 75)) * 2 + (esg_score >= 65)
+
+    return [
+        {
+            "climate_score": int(climate_score[i]),
+            "climate_level": CLIMATE_LABELS[int(climate_level[i])],
+            "default_probability": float(default_probability[i]),
+            "ai_credit_score": int(ai_credit[i]),
+            "esg_score": int(esg_score[i]),
+            "esg_credit_score": int(esg_credit[i]),
+            "interest_rate": round(float(interest_rate[i]), 2),
+            "collateral_ratio": round(float(collateral_ratio[i]), 2),
+            "suggested_tenure": int(suggested_tenure[i]),
+            "decision": DECISION_LABELS[int(decisions[i])],
+            "predicted_credit_score": int(credit_score[i]),
+            "early_warning_message": _WARNING_LUT[warning_index[i]][1],
+            "model_confidence": round(float(confidence[i]), 2),
+            "model_algorithm": model_algorithm_name(),
+        }
+        for i in range(len(rows))
+    ]
 
 
 def register_view(request):
@@ -372,7 +644,7 @@ def register_view(request):
         password = request.POST.get("password", "")
         role = request.POST.get("role", UserProfile.ROLE_OFFICER)
 
-        if role not in dict(UserProfile.ROLE_CHOICES):
+        if role not in UserProfile.VALID_ROLES:
             role = UserProfile.ROLE_OFFICER
 
         if not username or not password:
@@ -400,7 +672,6 @@ def login_view(request):
 
         if user:
             login(request, user)
-            get_or_create_profile(user)
             if not is_authorized_role(user):
                 logout(request)
                 return render(request, "unauthorized.html", status=403)
@@ -428,66 +699,63 @@ def demo_access_view(request):
     profile.role = UserProfile.ROLE_MANAGER
     profile.save(update_fields=["role"])
 
-    login(request, user)
+    login(request, user, backend="core.backends.ProfileModelBackend")
     return redirect("dashboard")
 
 
+# Newest applications fetched for the dashboard; every panel is a prefix or filter of this window.
+DASHBOARD_WINDOW = 100
+
+
 @login_required
 @never_cache
 def dashboard(request):
     if not is_authorized_role(request.user):
         return render(request, "unauthorized.html", status=403)
 
-    seed_default_locations()
-    role = get_or_create_profile(request.user).role
+    role = user_role(request.user)
     applications = ClimateCreditApplication.objects.all() if role in {UserProfile.ROLE_MANAGER, UserProfile.ROLE_AUDITOR} else ClimateCreditApplication.objects.filter(user=request.user)
 
-    # Ensure all applications have final_decision and early_warning_message populated
-    for app in applications:
-        # Regenerate decision if missing
-        if not app.final_decision or app.final_decision == "":
-            app.final_decision = decision_engine(
-                app.adjusted_credit_score,
-                app.climate_risk_classification,
-                app.loan_amount,
-                app.default_probability
-            )
-            app.save(update_fields=["final_decision"])
-        
-        # Regenerate early warning if missing
-        if app.early_warning_flag and (not app.early_warning_message or app.early_warning_message == ""):
-            warning_flag, warning_msg = early_warning(app.default_probability, app.climate_risk_score, app.esg_risk_score)
-            app.early_warning_flag = warning_flag
-            app.early_warning_message = warning_msg
-            app.save(update_fields=["early_warning_flag", "early_warning_message"])
-
-    metrics = applications.aggregate(
-        total=Count("id"),
-        avg_risk=Avg("climate_risk_score"),
-        avg_default=Avg("default_probability"),
-        avg_esg=Avg("esg_risk_score"),
-        avg_interest=Avg("suggested_interest_rate"),
-        avg_ai_credit=Avg("ai_credit_score"),
-        avg_esg_credit=Avg("esg_aligned_credit_score"),
+    summaries = UserDashboardSummary.objects.all() if role in {UserProfile.ROLE_MANAGER, UserProfile.ROLE_AUDITOR} else UserDashboardSummary.objects.filter(user=request.user)
+    totals = summaries.aggregate(
+        total=Sum("total_apps"),
+        approved=Sum("approved"),
+        conditional=Sum("conditional"),
+        rejected=Sum("rejected"),
+        warnings=Sum("warnings"),
+        **{key: Sum(key) for key in SUMMARY_SUM_FIELDS},
     )
+    total = totals["total"] or 0
+
+    def average(key):
+        return round(totals[key] / total, 2) if total else 0
 
     kpis = {
-        "total": metrics["total"] or 0,
-        "avg_risk": round(metrics["avg_risk"] or 0, 2),
-        "avg_default": round(metrics["avg_default"] or 0, 2),
-        "avg_esg": round(metrics["avg_esg"] or 0, 2),
-        "avg_interest": round(metrics["avg_interest"] or 0, 2),
-        "avg_ai_credit": round(metrics["avg_ai_credit"] or 0, 2),
-        "avg_esg_credit": round(metrics["avg_esg_credit"] or 0, 2),
-        "approved": applications.filter(final_decision=ClimateCreditApplication.DECISION_AUTO_APPROVE).count(),
-        "conditional": applications.filter(final_decision=ClimateCreditApplication.DECISION_CONDITIONAL).count(),
-        "rejected": applications.filter(final_decision=ClimateCreditApplication.DECISION_REJECT).count(),
-        "warnings": applications.filter(early_warning_flag=True).count(),
+        "total": total,
+        "avg_risk": average("sum_risk"),
+        "avg_default": average("sum_default"),
+        "avg_esg": average("sum_esg"),
+        "avg_interest": average("sum_interest"),
+        "avg_ai_credit": average("sum_ai_credit"),
+        "avg_esg_credit": average("sum_esg_credit"),
+        "approved": totals["approved"] or 0,
+        "conditional": totals["conditional"] or 0,
+        "rejected": totals["rejected"] or 0,
+        "warnings": totals["warnings"] or 0,
     }
 
-    severe_flags = applications.filter(climate_risk_classification__in=[ClimateCreditApplication.CLIMATE_HIGH, ClimateCreditApplication.CLIMATE_SEVERE]).distinct()[:8]
-    warning_alerts = applications.filter(early_warning_flag=True).distinct()[:10]
+    # One fetch of the newest rows feeds the table, the map and both alert panels.
+    recent = list(applications.for_list("latitude", "longitude", "early_warning_flag")[:DASHBOARD_WINDOW])
+    window_full = len(recent) == DASHBOARD_WINDOW
+
+    severe_flags = [item for item in recent if item.climate_risk_classification >= ClimateCreditApplication.CLIMATE_HIGH][:8]
+    if len(severe_flags) < 8 and window_full:
+        # Older rows may still qualify, so fall back to querying beyond the window.
+        severe_flags = applications.for_list().filter(climate_risk_classification__gte=ClimateCreditApplication.CLIMATE_HIGH)[:8]
 
+    warning_alerts = [item for item in recent if item.early_warning_flag][:10]
+    if len(warning_alerts) < 10 and window_full:
+        warning_alerts = applications.for_list().filter(early_warning_flag=True)[:10]
 
     map_points = [
         {
@@ -495,10 +763,10 @@ def dashboard(request):
             "lat": item.latitude,
             "lon": item.longitude,
             "risk": item.climate_risk_score,
-            "decision": item.final_decision,
+            "decision": DECISION_LABELS[item.final_decision],
             "esg": item.esg_risk_score,
         }
-        for item in applications[:80]
+        for item in recent[:80]
     ]
 
     advantages = [
@@ -516,34 +784,55 @@ def dashboard(request):
         request,
         "dashboard.html",
         {
-            "applications": applications[:40],
+            "applications": recent[:40],
             "role": role,
             "kpis": kpis,
             "severe_flags": severe_flags,
             "warning_alerts": warning_alerts,
-            "map_points": json.dumps(map_points),
+            "map_points": orjson.dumps(map_points).decode(),
             "advantages": advantages,
+            "decision_choices": ClimateCreditApplication.DECISION_CHOICES,
         },
     )
 
 
+# The lookup blob is shared through the Django cache under a catalog version token that
+# LocationCatalog signals replace; each process also keeps the copy for the version it last saw.
+_LOCATION_LOOKUP_CACHE = {"version": None, "states": None, "json": None}
+
+
+def get_location_lookup():
+    version = location_lookup_version()
+    if _LOCATION_LOOKUP_CACHE["version"] == version:
+        return _LOCATION_LOOKUP_CACHE["states"], _LOCATION_LOOKUP_CACHE["json"]
+
+    cached = cache.get(location_lookup_cache_key(version))
+    if cached is None:
+        location_lookup = {}
+        for item in LocationCatalog.objects.all().order_by("state", "name"):
+            if item.state not in location_lookup:
+                location_lookup[item.state] = []
+            location_lookup[item.state].append(
+                {
+                    "name": item.name,
+                    "lat": item.latitude,
+                    "lon": item.longitude,
+                }
+            )
+        cached = (sorted(location_lookup), orjson.dumps(location_lookup).decode())
+        # Stored under the version read before the query, so a concurrent change forces another rebuild.
+        cache.set(location_lookup_cache_key(version), cached, LOCATION_LOOKUP_CACHE_TIMEOUT)
+
+    states, lookup_json = cached
+    _LOCATION_LOOKUP_CACHE.update(version=version, states=states, json=lookup_json)
+    return states, lookup_json
+
+
 @login_required
 @role_required({UserProfile.ROLE_OFFICER, UserProfile.ROLE_MANAGER})
 @never_cache
 def apply_loan(request):
-    seed_default_locations()
-    states = sorted(set(LocationCatalog.objects.values_list("state", flat=True)))
-    location_lookup = {}
-    for item in LocationCatalog.objects.all().order_by("state", "name"):
-        if item.state not in location_lookup:
-            location_lookup[item.state] = []
-        location_lookup[item.state].append(
-            {
-                "name": item.name,
-                "lat": item.latitude,
-                "lon": item.longitude,
-            }
-        )
+    states, location_lookup_json = get_location_lookup()
 
     if request.method == "POST":
         borrower_name = request.POST.get("borrower_name", "").strip()
@@ -569,7 +858,7 @@ def apply_loan(request):
                 "apply_loan.html",
                 {
                     "states": states,
-                    "location_lookup": json.dumps(location_lookup),
+                    "location_lookup": location_lookup_json,
                     "error": "Please enter valid numeric values.",
                 },
             )
@@ -581,7 +870,7 @@ def apply_loan(request):
                 "apply_loan.html",
                 {
                     "states": states,
-                    "location_lookup": json.dumps(location_lookup),
+                    "location_lookup": location_lookup_json,
                     "error": "Please search and select a location from the suggestions.",
                 },
             )
@@ -592,18 +881,29 @@ def apply_loan(request):
                 "apply_loan.html",
                 {
                     "states": states,
-                    "location_lookup": json.dumps(location_lookup),
+                    "location_lookup": location_lookup_json,
                     "error": "Location Error: coordinates are outside India boundary.",
                 },
             )
 
+        if id_type not in ClimateCreditApplication.VALID_ID_TYPES or property_type not in ClimateCreditApplication.VALID_PROPERTY_TYPES:
+            return render(
+                request,
+                "apply_loan.html",
+                {
+                    "states": states,
+                    "location_lookup": location_lookup_json,
+                    "error": "Please select a valid ID type and property type.",
+                },
+            )
+
         if id_type == ClimateCreditApplication.ID_AADHAAR and not is_valid_aadhaar(borrower_id):
             return render(
                 request,
                 "apply_loan.html",
                 {
                     "states": states,
-                    "location_lookup": json.dumps(location_lookup),
+                    "location_lookup": location_lookup_json,
                     "error": "Aadhaar must be exactly 12 digits.",
                 },
             )
@@ -614,12 +914,12 @@ def apply_loan(request):
                 "apply_loan.html",
                 {
                     "states": states,
-                    "location_lookup": json.dumps(location_lookup),
+                    "location_lookup": location_lookup_json,
                     "error": "PAN must match format: AAAAA9999A.",
                 },
             )
 
-        location, created_custom = find_or_create_location(
+        location, created_custom = find_or_build_location(
             location_state,
             location_city,
             latitude,
@@ -628,7 +928,14 @@ def apply_loan(request):
             request.user,
         )
 
-        rainfall, flood, cyclone, drought = aggregate_climate_data(location, income, loan_amount)
+        rainfall, flood, cyclone, drought = aggregate_climate_data(
+            location.rainfall_index,
+            location.flood_index,
+            location.cyclone_index,
+            location.drought_index,
+            income,
+            loan_amount,
+        )
         property_risk_score = property_risk(property_type, property_value, loan_amount, flood, cyclone)
 
         if base_credit_score < 300:
@@ -663,98 +970,110 @@ def apply_loan(request):
         warning_flag, warning_msg = early_warning(default_probability, climate_score, esg_score, adjusted_credit_score)
 
         rationale = (
-            f"AI+Climate integrated scoring={climate_score} ({climate_level}), default probability={default_probability}%, "
+            f"AI+Climate integrated scoring={climate_score} ({CLIMATE_LABELS[climate_level]}), default probability={default_probability}%, "
             f"property risk={property_risk_score}, AI credit={predicted_ai_credit}, ESG credit={esg_credit}, "
             f"rate={interest_rate}%, collateral={collateral_ratio}%, tenure={suggested_tenure} months."
         )
 
-        if climate_level in {ClimateCreditApplication.CLIMATE_HIGH, ClimateCreditApplication.CLIMATE_SEVERE}:
+        if climate_level >= ClimateCreditApplication.CLIMATE_HIGH:
             rationale += " High climate risk policy triggered mandatory rejection."
 
-        # Check for duplicate: prevent multiple applications with same borrower_id in same state/city
-        existing = ClimateCreditApplication.objects.filter(
-            user=request.user,
-            borrower_id=borrower_id,
-            location_state=location_state,
-            location_district=location_city,
-        ).first()
-        
-        if existing:
-            # Return existing application instead of creating duplicate
-            return render(
-                request,
-                "apply_loan.html",
-                {
-                    "states": states,
-                    "location_lookup": json.dumps(location_lookup),
-                    "error": f"An application with this borrower already exists for {location_city}, {location_state}. Application ID: {existing.id}",
-                    "success": False,
-                },
+        # One commit for the custom location, the application, its summary refresh and the audit entries;
+        # scoring above stays outside so the write lock is not held during it.
+        with transaction.atomic():
+            if created_custom:
+                location.save()
+
+            # Check for duplicate: prevent multiple applications with same borrower_id in same state/city
+            existing = ClimateCreditApplication.objects.filter(
+                user=request.user,
+                borrower_id=borrower_id,
+                location_state=location_state,
+                location_district=location_city,
+            ).first()
+
+            if existing:
+                # Return existing application instead of creating duplicate
+                return render(
+                    request,
+                    "apply_loan.html",
+                    {
+                        "states": states,
+                        "location_lookup": location_lookup_json,
+                        "error": f"An application with this borrower already exists for {location_city}, {location_state}. Application ID: {existing.id}",
+                        "success": False,
+                    },
+                )
+
+            application = ClimateCreditApplication.objects.create(
+                user=request.user,
+                borrower_name=borrower_name,
+                id_type=id_type,
+                borrower_id=borrower_id,
+                property_type=property_type,
+                property_value=property_value,
+                property_risk_score=property_risk_score,
+                location_state=location_state,
+                location_district=location_city,
+                latitude=latitude,
+                longitude=longitude,
+                income=income,
+                base_credit_score=base_credit_score,
+                ai_credit_score=predicted_ai_credit,
+                esg_aligned_credit_score=esg_credit,
+                loan_amount=loan_amount,
+                is_location_valid=True,
+                rainfall_trend=round(rainfall, 2),
+                flood_history=round(flood, 2),
+                cyclone_path_risk=round(cyclone, 2),
+                drought_index=round(drought, 2),
+                climate_risk_score=climate_score,
+                climate_risk_classification=climate_level,
+                adjusted_credit_score=adjusted_credit_score,
+                suggested_interest_rate=interest_rate,
+                suggested_collateral_ratio=collateral_ratio,
+                suggested_tenure_months=suggested_tenure,
+                decision=decision,
+                esg_risk_score=esg_score,
+                default_probability=default_probability,
+                esg_lending_recommendation=esg_reco,
+                early_warning_flag=warning_flag,
+                early_warning_message=warning_msg,
+                model_algorithm=model_algorithm_name(),
+                model_confidence=model_confidence,
+                final_decision=decision,
+                decision_rationale=rationale,
             )
 
-        application = ClimateCreditApplication.objects.create(
-            user=request.user,
-            borrower_name=borrower_name,
-            id_type=id_type,
-            borrower_id=borrower_id,
-            property_type=property_type,
-            property_value=property_value,
-            property_risk_score=property_risk_score,
-            location_state=location_state,
-            location_district=location_city,
-            latitude=latitude,
-            longitude=longitude,
-            income=income,
-            base_credit_score=base_credit_score,
-            ai_credit_score=predicted_ai_credit,
-            esg_aligned_credit_score=esg_credit,
-            loan_amount=loan_amount,
-            is_location_valid=True,
-            rainfall_trend=round(rainfall, 2),
-            flood_history=round(flood, 2),
-            cyclone_path_risk=round(cyclone, 2),
-            drought_index=round(drought, 2),
-            climate_risk_score=climate_score,
-            climate_risk_classification=climate_level,
-            adjusted_credit_score=adjusted_credit_score,
-            suggested_interest_rate=interest_rate,
-            suggested_collateral_ratio=collateral_ratio,
-            suggested_tenure_months=suggested_tenure,
-            decision=decision,
-            esg_risk_score=esg_score,
-            default_probability=default_probability,
-            esg_lending_recommendation=esg_reco,
-            early_warning_flag=warning_flag,
-            early_warning_message=warning_msg,
-            model_algorithm="RandomForestRegressor",
-            model_confidence=model_confidence,
-            final_decision=decision,
-            decision_rationale=rationale,
-        )
-
-        risk_factors = (
-            f"rain={application.rainfall_trend}, flood={application.flood_history}, cyclone={application.cyclone_path_risk}, "
-            f"drought={application.drought_index}, property_risk={application.property_risk_score}, "
-            f"ai_confidence={application.model_confidence}%"
-        )
-
-        AuditLog.objects.create(
-            application=application,
-            user=request.user,
-            action=AuditLog.ACTION_CREATE,
-            decision=application.final_decision,
-            risk_factors=risk_factors,
-            details=f"Application created and scored. Custom location created={created_custom}.",
-        )
+            risk_factors = {
+                "rain": application.rainfall_trend,
+                "flood": application.flood_history,
+                "cyclone": application.cyclone_path_risk,
+                "drought": application.drought_index,
+                "property_risk": application.property_risk_score,
+                "ai_confidence": application.model_confidence,
+            }
 
-        AuditLog.objects.create(
-            application=application,
-            user=request.user,
-            action=AuditLog.ACTION_FINAL_CONFIRM,
-            decision=application.final_decision,
-            risk_factors=risk_factors,
-            details="Final decision confirmed.",
-        )
+            AuditLog.objects.bulk_create(
+                [
+                    AuditLog(
+                        application=application,
+                        user=request.user,
+                        action=AuditLog.ACTION_CREATE,
+                        decision=application.final_decision,
+                        risk_factors=risk_factors,
+                        details=f"Application created and scored. Custom location created={created_custom}.",
+                    ),
+                    AuditLog(
+                        application=application,
+                        user=request.user,
+                        action=AuditLog.ACTION_FINAL_CONFIRM,
+                        decision=application.final_decision,
+                        risk_factors=risk_factors,
+                        details="Final decision confirmed.",
+                    ),
+                ]
+            )
 
         return redirect("dashboard")
 
@@ -763,43 +1082,73 @@ def apply_loan(request):
         "apply_loan.html",
         {
             "states": states,
-            "location_lookup": json.dumps(location_lookup),
+            "location_lookup": location_lookup_json,
         },
     )
 
 
+REALTIME_BATCH_LIMIT = 1000
+
+
+def orjson_response(data, status=200):
+    # Scoring payloads are plain floats, ints and strings, so DjangoJSONEncoder adds nothing.
+    return HttpResponse(orjson.dumps(data), content_type="application/json", status=status)
+
+
+class ScoreRequest(NamedTuple):
+    income: float
+    credit_score: int
+    loan_amount: float
+    property_value: float
+    tenure_months: int
+    property_type: str
+    lat: float
+    lon: float
+
+
+def finite_float(value):
+    # float() accepts "nan" and "inf", which the scoring maths cannot handle.
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{value!r} is not a finite number")
+    return number
+
+
+def parse_realtime_application(payload):
+    return ScoreRequest(
+        finite_float(payload.get("income", 0)),
+        int(payload.get("credit_score", 0)),
+        finite_float(payload.get("loan_amount", 0)),
+        finite_float(payload.get("property_value", 0)),
+        int(payload.get("tenure_months", 0)),
+        str(payload.get("property_type", ClimateCreditApplication.PROPERTY_HOUSE)),
+        finite_float(payload.get("lat", 0)),
+        finite_float(payload.get("lon", 0)),
+    )
+
+
 @login_required
 @role_required({UserProfile.ROLE_OFFICER, UserProfile.ROLE_MANAGER})
 @require_http_methods(["POST"])
 def realtime_decision_api(request):
     try:
-        payload = json.loads(request.body.decode("utf-8"))
-        income = float(payload.get("income", 0))
-        base_credit_score = int(payload.get("credit_score", 0))
-        loan_amount = float(payload.get("loan_amount", 0))
-        property_value = float(payload.get("property_value", 0))
-        tenure_months = int(payload.get("tenure_months", 0))
-        property_type = str(payload.get("property_type", ClimateCreditApplication.PROPERTY_HOUSE))
-        lat = float(payload.get("lat", 0))
-        lon = float(payload.get("lon", 0))
-    except (TypeError, ValueError, json.JSONDecodeError):
+        payload = orjson.loads(request.body)
+        batch = isinstance(payload, dict) and "applications" in payload
+        if batch:
+            items = payload["applications"]
+            if not isinstance(items, list) or not 0 < len(items) <= REALTIME_BATCH_LIMIT:
+                return JsonResponse({"error": f"applications must be a list of 1-{REALTIME_BATCH_LIMIT} items"}, status=400)
+            rows = [parse_realtime_application(item) for item in items]
+        else:
+            income, base_credit_score, loan_amount, property_value, tenure_months, property_type, lat, lon = parse_realtime_application(payload)
+    except (AttributeError, TypeError, ValueError):
         return JsonResponse({"error": "Invalid input"}, status=400)
 
+    if batch:
+        return orjson_response({"results": score_applications_batch(rows)})
+
     rainfall, flood, cyclone, drought = derive_climate_profile(lat, lon)
-    rainfall, flood, cyclone, drought = aggregate_climate_data(
-        LocationCatalog(
-            name="Temp",
-            state="Temp",
-            latitude=lat,
-            longitude=lon,
-            rainfall_index=rainfall,
-            flood_index=flood,
-            cyclone_index=cyclone,
-            drought_index=drought,
-        ),
-        income,
-        loan_amount,
-    )
+    rainfall, flood, cyclone, drought = aggregate_climate_data(rainfall, flood, cyclone, drought, income, loan_amount)
 
     property_risk_score = property_risk(property_type, property_value, loan_amount, flood, cyclone)
 
@@ -816,10 +1165,10 @@ def realtime_decision_api(request):
     decision = decision_engine(ai_credit, climate_level, loan_amount, default_probability)
     warning_flag, warning_msg = early_warning(default_probability, climate_score, esg_score, ai_credit)
 
-    return JsonResponse(
+    return orjson_response(
         {
             "climate_score": climate_score,
-            "climate_level": climate_level,
+            "climate_level": CLIMATE_LABELS[climate_level],
             "default_probability": round(default_probability, 2),
             "ai_credit_score": ai_credit,
             "esg_score": esg_score,
@@ -827,11 +1176,11 @@ def realtime_decision_api(request):
             "interest_rate": round(interest_rate, 2),
             "collateral_ratio": round(collateral_ratio, 2),
             "suggested_tenure": suggested_tenure,
-            "decision": decision,
+            "decision": DECISION_LABELS[decision],
             "predicted_credit_score": base_credit_score,
             "early_warning_message": warning_msg,
             "model_confidence": round(model_confidence, 2),
-            "model_algorithm": "RandomForestRegressor (ML)",
+            "model_algorithm": model_algorithm_name(),
         }
     )
 
@@ -841,38 +1190,46 @@ def realtime_decision_api(request):
 @require_http_methods(["POST"])
 def override_decision(request, app_id):
     application = get_object_or_404(ClimateCreditApplication, id=app_id)
-    override = request.POST.get("override_decision", "")
-
-    valid_decisions = {choice[0] for choice in ClimateCreditApplication.DECISION_CHOICES}
-    if override not in valid_decisions:
+    try:
+        override = int(request.POST.get("override_decision", ""))
+    except ValueError:
         return redirect("dashboard")
 
-    if application.climate_risk_classification in {ClimateCreditApplication.CLIMATE_HIGH, ClimateCreditApplication.CLIMATE_SEVERE} and override != ClimateCreditApplication.DECISION_REJECT:
+    if override not in ClimateCreditApplication.VALID_DECISIONS:
         return redirect("dashboard")
 
-    application.manager_override_decision = override
-    application.final_decision = override
-    application.save(update_fields=["manager_override_decision", "final_decision", "updated_at"])
-
-    AuditLog.objects.create(
-        application=application,
-        user=request.user,
-        action=AuditLog.ACTION_OVERRIDE,
-        decision=override,
-        risk_factors=(
-            f"climate_score={application.climate_risk_score}, adjusted_credit={application.adjusted_credit_score}, "
-            f"esg={application.esg_risk_score}, default={application.default_probability}"
-        ),
-        details="Manager override applied.",
-    )
+    if application.climate_risk_classification >= ClimateCreditApplication.CLIMATE_HIGH and override != ClimateCreditApplication.DECISION_REJECT:
+        return redirect("dashboard")
 
-    AuditLog.objects.create(
-        application=application,
-        user=request.user,
-        action=AuditLog.ACTION_FINAL_CONFIRM,
-        decision=override,
-        details="Final decision reconfirmed after manager override.",
-    )
+    with transaction.atomic():
+        application.manager_override_decision = override
+        application.final_decision = override
+        application.save(update_fields=["manager_override_decision", "final_decision", "updated_at"])
+
+        AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    application=application,
+                    user=request.user,
+                    action=AuditLog.ACTION_OVERRIDE,
+                    decision=override,
+                    risk_factors={
+                        "climate_score": application.climate_risk_score,
+                        "adjusted_credit": application.adjusted_credit_score,
+                        "esg": application.esg_risk_score,
+                        "default": application.default_probability,
+                    },
+                    details="Manager override applied.",
+                ),
+                AuditLog(
+                    application=application,
+                    user=request.user,
+                    action=AuditLog.ACTION_FINAL_CONFIRM,
+                    decision=override,
+                    details="Final decision reconfirmed after manager override.",
+                ),
+            ]
+        )
 
     return redirect("dashboard")
 
@@ -884,7 +1241,7 @@ def delete_application(request, app_id):
     application = get_object_or_404(ClimateCreditApplication, id=app_id)
 
     # Only managers can delete applications
-    if get_or_create_profile(request.user).role != UserProfile.ROLE_MANAGER:
+    if user_role(request.user) != UserProfile.ROLE_MANAGER:
         return redirect("dashboard")
 
     # Create audit log before deletion
@@ -893,10 +1250,12 @@ def delete_application(request, app_id):
         user=request.user,
         action=AuditLog.ACTION_DELETE,
         decision=application.final_decision,
-        risk_factors=(
-            f"climate_score={application.climate_risk_score}, adjusted_credit={application.adjusted_credit_score}, "
-            f"esg={application.esg_risk_score}, default={application.default_probability}"
-        ),
+        risk_factors={
+            "climate_score": application.climate_risk_score,
+            "adjusted_credit": application.adjusted_credit_score,
+            "esg": application.esg_risk_score,
+            "default": application.default_probability,
+        },
         details=f"Application deleted by manager. Borrower: {application.borrower_name}, ID: {application.borrower_id}",
     )
 
@@ -906,52 +1265,119 @@ def delete_application(request, app_id):
     return redirect("dashboard")
 
 
+# PostgreSQL enforces this cap with the trim trigger (migrations 0018 and 0021), which
+# freezes its own copy; changing it here needs a migration that recreates the trigger.
+PLACE_HISTORY_LIMIT = 12
+PLACE_COORD_STEP = Decimal("0.0001")
+# Room for a 255-character place name in multi-byte UTF-8 plus the coordinates.
+PLACE_HISTORY_MAX_BODY = 1024
+# Fixed response bodies, encoded once at import.
+PLACE_HISTORY_OK = orjson.dumps({"ok": True})
+PLACE_HISTORY_INVALID = orjson.dumps({"error": "Invalid payload"})
+PLACE_HISTORY_NO_PLACE = orjson.dumps({"error": "Place is required"})
+PLACE_HISTORY_BAD_COORDS = orjson.dumps({"error": "Coordinates out of range"})
+PLACE_HISTORY_TOO_LARGE = orjson.dumps({"error": "Payload too large"})
+PLACE_HISTORY_TRIM_SQL = (
+    "DELETE FROM {table} WHERE user_id = %s AND id NOT IN "
+    "(SELECT id FROM {table} WHERE user_id = %s ORDER BY created_at DESC LIMIT %s)"
+).format(table=PlaceHistory._meta.db_table)
+PLACE_HISTORY_CACHE_TIMEOUT = 300
+
+
+def get_place_history(user_id):
+    """Return the cached {"body", "etag"} snapshot of a user's recent places."""
+    def load_history():
+        # Coordinates come back from the DecimalFields already at four places.
+        rows = PlaceHistory.objects.filter(user_id=user_id).values_list("place_name", "latitude", "longitude")
+        items = [
+            {"place": place_name, "lat": str(latitude), "lon": str(longitude)}
+            for place_name, latitude, longitude in rows[:PLACE_HISTORY_LIMIT]
+        ]
+        body = orjson.dumps({"items": items})
+        return {"body": body, "etag": hashlib.md5(body).hexdigest()}
+
+    version = place_history_version(user_id)
+    return cache.get_or_set(place_history_cache_key(user_id, version), load_history, PLACE_HISTORY_CACHE_TIMEOUT)
+
+
+def place_history_snapshot(request):
+    # The ETag check and the response body share one cache read per request.
+    if not hasattr(request, "_place_history"):
+        request._place_history = get_place_history(request.user.pk)
+    return request._place_history
+
+
+def json_bytes_response(body, status=200):
+    return HttpResponse(body, content_type="application/json", status=status)
+
+
+# Revalidation is ETag-only: Last-Modified has one-second granularity, so a save
+# within the same second as a GET would let If-Modified-Since serve a stale 304.
+def place_history_etag(request):
+    if request.method != "GET":
+        return None
+    return place_history_snapshot(request)["etag"]
+
+
 @login_required
 @require_http_methods(["GET", "POST"])
+@condition(etag_func=place_history_etag)
 def place_history_api(request):
     if request.method == "GET":
-        items = PlaceHistory.objects.filter(user=request.user)[:12]
-        data = [
-            {
-                "place": item.place_name,
-                "lat": f"{item.latitude:.4f}",
-                "lon": f"{item.longitude:.4f}",
-            }
-            for item in items
-        ]
-        return JsonResponse({"items": data})
+        # The snapshot holds the serialized body, so a cache hit does no encoding.
+        return json_bytes_response(place_history_snapshot(request)["body"])
+
+    if len(request.body) > PLACE_HISTORY_MAX_BODY:
+        return json_bytes_response(PLACE_HISTORY_TOO_LARGE, status=413)
 
     try:
-        payload = json.loads(request.body.decode("utf-8"))
-        place = str(payload.get("place", "")).strip()
-        lat = round(float(payload.get("lat")), 4)
-        lon = round(float(payload.get("lon")), 4)
-    except (ValueError, TypeError, json.JSONDecodeError):
-        return JsonResponse({"error": "Invalid payload"}, status=400)
+        payload = orjson.loads(request.body)
+        place = str(payload.get("place", "")).strip()[:255]
+        lat = Decimal(str(payload.get("lat"))).quantize(PLACE_COORD_STEP)
+        lon = Decimal(str(payload.get("lon"))).quantize(PLACE_COORD_STEP)
+    except (AttributeError, InvalidOperation, TypeError, ValueError):
+        return json_bytes_response(PLACE_HISTORY_INVALID, status=400)
+    if lat.is_nan() or lon.is_nan():
+        return json_bytes_response(PLACE_HISTORY_INVALID, status=400)
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return json_bytes_response(PLACE_HISTORY_BAD_COORDS, status=400)
 
     if not place:
-        return JsonResponse({"error": "Place is required"}, status=400)
-
-    PlaceHistory.objects.filter(user=request.user, latitude=lat, longitude=lon).delete()
-    PlaceHistory.objects.create(
-        user=request.user,
-        place_name=place[:255],
-        latitude=lat,
-        longitude=lon,
-    )
-
-    stale = PlaceHistory.objects.filter(user=request.user).order_by("-created_at")[12:]
-    if stale:
-        stale.delete()
+        return json_bytes_response(PLACE_HISTORY_NO_PLACE, status=400)
+
+    uid = request.user.pk
+    entry = PlaceHistory(user_id=uid, place_name=place, latitude=lat, longitude=lon)
+    # A single upsert; revisiting a place renames it and moves it to the top.
+    with transaction.atomic():
+        # Re-posting the newest place changes nothing, so skip the writes and keep the cached list.
+        newest = PlaceHistory.objects.filter(user_id=uid).values_list("place_name", "latitude", "longitude").first()
+        if newest == (place, lat, lon):
+            return json_bytes_response(PLACE_HISTORY_OK)
+
+        PlaceHistory.objects.bulk_create(
+            [entry],
+            update_conflicts=True,
+            unique_fields=["user", "latitude", "longitude"],
+            update_fields=["place_name", "created_at"],
+        )
+        # PostgreSQL trims new rows with a trigger (migration 0018).
+        if connection.vendor != "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(PLACE_HISTORY_TRIM_SQL, [uid, uid, PLACE_HISTORY_LIMIT])
 
-    return JsonResponse({"ok": True})
+    invalidate_place_history(uid)
+    return json_bytes_response(PLACE_HISTORY_OK)
 
 
 @login_required
 @require_http_methods(["POST"])
 def clear_place_history_api(request):
-    PlaceHistory.objects.filter(user=request.user).delete()
-    return JsonResponse({"ok": True})
+    # Nothing references PlaceHistory, so skip the deletion collector and signals.
+    uid = request.user.pk
+    history = PlaceHistory.objects.filter(user_id=uid)
+    history._raw_delete(history.db)
+    invalidate_place_history(uid)
+    return json_bytes_response(PLACE_HISTORY_OK)
 
 
 @require_http_methods(["POST"])
@@ -963,7 +1389,7 @@ def fetch_location_api(request):
     """
     try:
         payload = json.loads(request.body.decode("utf-8"))
-        place = str(payload.get("place", "")).strip()
+        place = str(payload.get("place", "")).strip()[:255]
         state = str(payload.get("state", "")).strip()
     except (ValueError, TypeError, json.JSONDecodeError):
         return JsonResponse({"error": "Invalid payload"}, status=400)